@@ -45,8 +45,8 @@ class TransformationResult:
     data: Optional["pl.DataFrame"]  # Final transformed data
     step_results: List[StepResult]
     total_execution_time_ms: float
-    rows_in: int
-    rows_out: int
+    rows_in: Optional[int]  # None when the input was an uncollected LazyFrame
+    rows_out: Optional[int]
     error_message: Optional[str] = None
     
     @property
@@ -59,6 +59,29 @@ class TransformationResult:
         """Total number of steps in the pipeline."""
         return len(self.step_results)
     
+    def to_lookup(self, key: str, value: str) -> Dict[Any, Any]:
+        """
+        Build a dictionary mapping one result column to another.
+        
+        Each column is converted to a Python list in one call and the two
+        lists are zipped, which is faster than iterating result rows.
+        
+        Args:
+            key: Column whose values become dictionary keys
+            value: Column whose values become dictionary values
+            
+        Returns:
+            Dictionary of key -> value (later rows win on duplicate keys)
+            
+        Raises:
+            ValueError: If the result carries no data
+        """
+        if self.data is None:
+            raise ValueError(
+                f"Pipeline '{self.pipeline_id}' result has no data to build a lookup from"
+            )
+        return dict(zip(self.data[key].to_list(), self.data[value].to_list()))
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
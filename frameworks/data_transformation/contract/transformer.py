@@ -68,6 +68,14 @@ class Transformer(ABC):
             
         Raises:
             TransformationError: If transformation fails
+            
+        Note:
+            Column-only transformers (select, drop, rename, with_columns)
+            and the explode and unpivot reshapes also accept a pl.LazyFrame
+            and return one, so a caller can chain them and collect once.
+            Pivot needs every 'on' value up front and stays eager. The
+            engine still materializes each step because it records per-step
+            row counts.
         """
         pass
     
@@ -2,6 +2,8 @@
 
 import ast
 import operator
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 
 import polars as pl
@@ -123,6 +125,12 @@ class ExpressionParser:
         ast.Not: operator.not_,
     }
     
+    # Parsed expressions shared by all parser instances, keyed by source
+    # string; the least recently used entry is evicted once the cache is full
+    _expression_cache: "OrderedDict[str, pl.Expr]" = OrderedDict()
+    _expression_cache_lock = threading.Lock()
+    EXPRESSION_CACHE_SIZE = 1024
+    
     def __init__(self) -> None:
         """Initialize the expression parser."""
         self._polars_funcs: Dict[str, Any] = {
@@ -157,9 +165,15 @@ class ExpressionParser:
         if not expression or not expression.strip():
             raise ExpressionParseError("Empty expression", expression)
         
+        with self._expression_cache_lock:
+            cached = self._expression_cache.get(expression)
+            if cached is not None:
+                self._expression_cache.move_to_end(expression)
+                return cached
+        
         try:
             tree = ast.parse(expression, mode='eval')
-            return self._eval_node(tree.body)
+            result = self._eval_node(tree.body)
         except SyntaxError as e:
             raise ExpressionParseError(
                 f"Syntax error: {e.msg}",
@@ -168,6 +182,21 @@ class ExpressionParser:
             )
         except Exception as e:
             raise ExpressionParseError(str(e), expression)
+        
+        # Only Polars expressions are cached; they are immutable and safe to share
+        if isinstance(result, pl.Expr):
+            with self._expression_cache_lock:
+                self._expression_cache[expression] = result
+                while len(self._expression_cache) > self.EXPRESSION_CACHE_SIZE:
+                    self._expression_cache.popitem(last=False)
+        
+        return result
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Discard all cached parsed expressions."""
+        with cls._expression_cache_lock:
+            cls._expression_cache.clear()
     
     def validate(self, expression: str) -> Optional[str]:
         """
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Union
 import polars as pl
 
 from frameworks.data_transformation.contract.result import TransformationResult
+from frameworks.data_transformation.engine.expression_parser import ExpressionParser
 
 
 class Pipeline:
@@ -255,6 +256,7 @@ class Pipeline:
         fraction: Optional[float] = None,
         seed: Optional[int] = None,
         with_replacement: bool = False,
+        shuffle: bool = True,
     ) -> "Pipeline":
         """
         Sample rows.
@@ -264,11 +266,16 @@ class Pipeline:
             fraction: Fraction of rows to sample (mutually exclusive with n)
             seed: Random seed for reproducibility
             with_replacement: Allow sampling same row multiple times
+            shuffle: Shuffle the sampled rows (False keeps input order and
+                skips the extra permutation pass)
             
         Returns:
             Self for method chaining
         """
-        config: Dict[str, Any] = {"with_replacement": with_replacement}
+        config: Dict[str, Any] = {
+            "with_replacement": with_replacement,
+            "shuffle": shuffle,
+        }
         if n is not None:
             config["n"] = n
         if fraction is not None:
@@ -557,6 +564,45 @@ class Pipeline:
         return self
     
     # Pipeline execution
+    def precompile(self) -> "Pipeline":
+        """
+        Parse all string expressions in the pipeline ahead of execution.
+        
+        Parsed expressions are kept in the shared ExpressionParser cache,
+        so the first execute() does not pay the parsing cost and invalid
+        expressions are reported when the pipeline is built.
+        
+        Returns:
+            Self for method chaining
+            
+        Raises:
+            ExpressionParseError: If any expression cannot be parsed
+        """
+        # Lazy import to avoid circular dependency
+        from frameworks.data_transformation.transformers.aggregate.group_by import GroupByTransformer
+        
+        parser = ExpressionParser()
+        for step in self._steps:
+            config = step["config"]
+            if step["type"] == "filter":
+                expressions = [config["condition"]]
+            elif step["type"] == "with_columns":
+                expressions = list(config["columns"].values())
+            elif step["type"] == "group_by":
+                expressions = [
+                    spec for spec in config["aggregations"].values()
+                    if isinstance(spec, str)
+                    and spec not in GroupByTransformer.AGGREGATION_FUNCTIONS
+                ]
+            else:
+                continue
+            
+            for expression in expressions:
+                if isinstance(expression, str):
+                    parser.parse(expression)
+        
+        return self
+    
     def execute(
         self,
         data: pl.DataFrame,
@@ -572,6 +618,20 @@ class Pipeline:
         Returns:
             TransformationResult with transformed data and execution info
         """
+        # Nothing to run: skip engine construction and step dispatch
+        if not self._steps:
+            # A LazyFrame's row count is unknown without collecting it
+            rows = len(data) if isinstance(data, pl.DataFrame) else None
+            return TransformationResult(
+                pipeline_id=self._pipeline_id,
+                success=True,
+                data=data,
+                step_results=[],
+                total_execution_time_ms=0.0,
+                rows_in=rows,
+                rows_out=rows,
+            )
+        
         # Lazy import to avoid circular dependency
         from frameworks.data_transformation.engine.transformation_engine import TransformationEngine
         
@@ -1,13 +1,54 @@
 """Test fixtures for Data Transformation Framework tests."""
 
+import os
+from datetime import date
+
+# The test frames have a handful of rows, so spreading work over Polars'
+# thread pool costs more than it saves. Polars is already imported by the
+# frameworks.data_transformation package when pytest loads this conftest, but
+# its thread pool starts lazily on first use, so setting the variable here
+# still takes effect. DT_TEST_POLARS_PARALLEL=1 keeps Polars' default thread
+# count (e.g. for benchmark runs), and an explicit POLARS_MAX_THREADS is
+# always respected.
+if os.environ.get("DT_TEST_POLARS_PARALLEL") != "1":
+    os.environ.setdefault("POLARS_MAX_THREADS", "1")
+
 import pytest
 import polars as pl
 
 from frameworks.data_transformation.engine.transformation_engine import TransformationEngine
 from frameworks.data_transformation.engine.transformation_context import TransformationContext
+from frameworks.data_transformation.engine.expression_parser import ExpressionParser
+
+
+def pytest_configure(config):
+    """Register markers used by these tests when pytest-xdist is not installed."""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run tests of the same group on one pytest-xdist worker",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _polars_test_env():
+    """Keep Polars' verbose logging off for the test run."""
+    pl.Config.set_verbose(False)
+    yield
+
 
+@pytest.fixture(scope="session", autouse=True)
+def _clear_expression_cache():
+    """Drop the process-wide parsed-expression cache when the session ends."""
+    yield
+    ExpressionParser.clear_cache()
 
-@pytest.fixture
+
+# DataFrame fixtures below are shared read-only inputs: transformers and the
+# engine always return new frames, so session scope is safe. Under
+# pytest-xdist every worker builds its own copy.
+
+
+@pytest.fixture(scope="session")
 def sample_customers_df() -> pl.DataFrame:
     """Sample customer DataFrame for testing."""
     return pl.DataFrame({
@@ -17,12 +58,12 @@ def sample_customers_df() -> pl.DataFrame:
                   "diana@test.com", "eve@test.com"],
         "status": ["active", "active", "inactive", "active", "inactive"],
         "age": [25, 30, 35, 28, 42],
-        "signup_date": ["2023-01-15", "2023-02-20", "2023-03-10", 
-                        "2023-04-05", "2023-05-12"],
+        "signup_date": [date(2023, 1, 15), date(2023, 2, 20), date(2023, 3, 10),
+                        date(2023, 4, 5), date(2023, 5, 12)],
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_orders_df() -> pl.DataFrame:
     """Sample orders DataFrame for testing joins."""
     return pl.DataFrame({
@@ -36,7 +77,7 @@ def sample_orders_df() -> pl.DataFrame:
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_products_df() -> pl.DataFrame:
     """Sample products DataFrame for testing."""
     return pl.DataFrame({
@@ -47,7 +88,7 @@ def sample_products_df() -> pl.DataFrame:
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_with_nulls() -> pl.DataFrame:
     """DataFrame with null values for testing null handling."""
     return pl.DataFrame({
@@ -58,7 +99,7 @@ def df_with_nulls() -> pl.DataFrame:
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_with_lists() -> pl.DataFrame:
     """DataFrame with list columns for testing explode."""
     return pl.DataFrame({
@@ -68,13 +109,24 @@ def df_with_lists() -> pl.DataFrame:
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_context(sample_customers_df) -> TransformationContext:
-    """Empty transformation context for testing."""
+    """
+    Empty transformation context for testing.
+    
+    Transformers only read the context (only the engine adds datasets or
+    step results to its own contexts), so one instance serves every test.
+    """
     return TransformationContext(data=sample_customers_df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def orders_context(sample_orders_df) -> TransformationContext:
+    """Context over the sample orders, shared by tests that only read it."""
+    return TransformationContext(data=sample_orders_df)
+
+
+@pytest.fixture(scope="session")
 def context_with_datasets(
     sample_customers_df,
     sample_orders_df,
@@ -90,7 +142,31 @@ def context_with_datasets(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def transformation_engine() -> TransformationEngine:
-    """Fresh transformation engine instance."""
+    """
+    Transformation engine shared by the whole session.
+    
+    Built-in transformers are registered once; anything a test adds is
+    rolled back by _reset_transformation_engine.
+    """
     return TransformationEngine()
+
+
+@pytest.fixture(autouse=True)
+def _reset_transformation_engine(request):
+    """Restore the shared engine's pipelines and transformers after each test."""
+    if "transformation_engine" not in request.fixturenames:
+        yield
+        return
+    
+    engine = request.getfixturevalue("transformation_engine")
+    pipelines = dict(engine._pipelines)
+    transformers = dict(engine._transformer_registry._transformers)
+    
+    yield
+    
+    engine._pipelines.clear()
+    engine._pipelines.update(pipelines)
+    engine._transformer_registry.clear()
+    engine._transformer_registry._transformers.update(transformers)
@@ -7,7 +7,6 @@ import json
 from pathlib import Path
 
 from frameworks.data_transformation.engine.transformation_engine import TransformationEngine
-from frameworks.data_transformation.engine.transformation_context import TransformationContext
 
 
 class TestEndToEndPipelines:
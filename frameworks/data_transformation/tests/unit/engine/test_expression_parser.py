@@ -1,5 +1,8 @@
 """Tests for ExpressionParser."""
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import polars as pl
 
@@ -284,6 +287,65 @@ class TestExpressionParserValidation:
         assert error is not None
 
 
+class TestExpressionParserCache:
+    """Tests for the shared parsed-expression cache."""
+    
+    def test_parse_reuses_cached_expression(self, parser):
+        """Test that parsing the same string twice returns the cached expression."""
+        first = parser.parse("col('age') * 2")
+        second = ExpressionParser().parse("col('age') * 2")
+        
+        assert first is second
+    
+    def test_clear_cache(self, parser):
+        """Test that clear_cache forces a fresh parse."""
+        first = parser.parse("col('salary') + 1")
+        ExpressionParser.clear_cache()
+        second = parser.parse("col('salary') + 1")
+        
+        assert first is not second
+    
+    def test_cache_evicts_least_recently_used(self, parser, monkeypatch):
+        """Test that a full cache evicts its oldest entry and keeps caching."""
+        monkeypatch.setattr(ExpressionParser, "EXPRESSION_CACHE_SIZE", 3)
+        monkeypatch.setattr(ExpressionParser, "_expression_cache", OrderedDict())
+        
+        first = parser.parse("col('a') + 1")
+        parser.parse("col('b') + 1")
+        parser.parse("col('c') + 1")
+        parser.parse("col('a') + 1")  # Mark 'a' as recently used
+        newest = parser.parse("col('d') + 1")
+        
+        cache = ExpressionParser._expression_cache
+        assert list(cache) == ["col('c') + 1", "col('a') + 1", "col('d') + 1"]
+        assert parser.parse("col('a') + 1") is first
+        assert parser.parse("col('d') + 1") is newest
+    
+    def test_cache_is_safe_under_concurrent_eviction(self, monkeypatch):
+        """Test that threads hitting and evicting the same entries do not race."""
+        monkeypatch.setattr(ExpressionParser, "EXPRESSION_CACHE_SIZE", 2)
+        monkeypatch.setattr(ExpressionParser, "_expression_cache", OrderedDict())
+        expressions = [f"col('c{i}') + 1" for i in range(4)]
+        
+        def parse_all(_):
+            parser = ExpressionParser()
+            for _ in range(200):
+                for expression in expressions:
+                    parser.parse(expression)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(parse_all, range(4)))
+        
+        assert len(ExpressionParser._expression_cache) == 2
+    
+    def test_literal_results_are_not_cached(self, parser):
+        """Test that non-expression results are returned fresh each time."""
+        first = parser.parse("[1, 2, 3]")
+        first.append(4)
+        
+        assert parser.parse("[1, 2, 3]") == [1, 2, 3]
+
+
 class TestExpressionParserSecurity:
     """Tests for expression parser security features."""
     
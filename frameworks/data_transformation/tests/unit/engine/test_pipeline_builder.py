@@ -5,6 +5,7 @@ import polars as pl
 from polars.testing import assert_frame_equal
 
 from frameworks.data_transformation.engine.pipeline_builder import Pipeline
+from frameworks.data_transformation.exceptions import ExpressionParseError
 
 
 class TestPipelineInit:
@@ -175,6 +176,17 @@ class TestPipelineRowOperations:
         assert result.success
         assert len(result.data) == 10  # 10% of 100
     
+    def test_sample_without_shuffle(self):
+        """Test sample with shuffle disabled keeps input order."""
+        df = pl.DataFrame({"value": list(range(100))})
+        
+        result = Pipeline("test").sample(n=10, seed=42, shuffle=False).execute(df)
+        
+        assert result.success
+        values = result.data["value"].to_list()
+        assert len(values) == 10
+        assert values == sorted(values)
+    
     def test_drop_nulls(self):
         """Test drop_nulls operation."""
         df = pl.DataFrame({"value": [1, None, 3, None, 5]})
@@ -259,7 +271,7 @@ class TestPipelineAggregateOperations:
         assert len(result.data) == 2
         
         # Check totals (order may vary)
-        totals = dict(zip(result.data["category"].to_list(), result.data["total"].to_list()))
+        totals = result.to_lookup("category", "total")
         assert totals["A"] == 30
         assert totals["B"] == 70
     
@@ -498,6 +510,48 @@ class TestPipelineExecution:
         assert result.success
         assert len(result.data) == 0
     
+    def test_execute_empty_pipeline_returns_input(self):
+        """Test that a pipeline without steps returns the input unchanged."""
+        df = pl.DataFrame({"a": [1, 2, 3]})
+        
+        result = Pipeline("test", description="Empty pipeline").execute(df)
+        
+        assert result.success
+        assert result.step_results == []
+        assert result.rows_in == 3
+        assert result.rows_out == 3
+        assert_frame_equal(result.data, df)
+    
+    def test_execute_empty_pipeline_lazy_frame(self):
+        """Test that an empty pipeline passes a LazyFrame through uncollected."""
+        lf = pl.DataFrame({"a": [1]}).lazy()
+        
+        result = Pipeline("test", description="Empty pipeline").execute(lf)
+        
+        assert result.success
+        assert result.data is lf
+        # Row counts are unknown without collecting the LazyFrame
+        assert result.rows_in is None
+        assert result.rows_out is None
+    
+    def test_to_lookup_same_key_and_value(self):
+        """Test that to_lookup maps a column onto itself."""
+        df = pl.DataFrame({"a": [1, 2, 3]})
+        
+        result = Pipeline("test").select(["a"]).execute(df)
+        
+        assert result.to_lookup("a", "a") == {1: 1, 2: 2, 3: 3}
+    
+    def test_to_lookup_without_data_raises(self):
+        """Test that to_lookup on a failed result raises."""
+        df = pl.DataFrame({"a": [1, 2, 3]})
+        
+        result = Pipeline("test").select(["nonexistent"]).execute(df)
+        
+        assert not result.success
+        with pytest.raises(ValueError, match="no data"):
+            result.to_lookup("a", "a")
+    
     def test_execute_does_not_modify_input(self):
         """Test that execute does not modify the input DataFrame."""
         df = pl.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
@@ -510,6 +564,37 @@ class TestPipelineExecution:
         assert len(df) == original_len
 
 
+class TestPipelinePrecompile:
+    """Tests for precompile method."""
+    
+    def test_precompile_returns_self(self):
+        """Test that precompile supports method chaining."""
+        pipeline = (
+            Pipeline("test")
+            .filter("col('a') > 0")
+            .with_columns({"b": "col('a') * 2", "c": 1})
+            .group_by(by="b", agg={"total": "col('a').sum()", "a": "count"})
+        )
+        
+        assert pipeline.precompile() is pipeline
+    
+    def test_precompile_reports_invalid_expression(self):
+        """Test that invalid expressions fail at precompile time."""
+        pipeline = Pipeline("test").filter("invalid_syntax!!!")
+        
+        with pytest.raises(ExpressionParseError):
+            pipeline.precompile()
+    
+    def test_precompiled_pipeline_executes(self):
+        """Test that a precompiled pipeline executes normally."""
+        df = pl.DataFrame({"a": [1, 2, 3]})
+        
+        result = Pipeline("test").filter("col('a') > 1").precompile().execute(df)
+        
+        assert result.success
+        assert result.data["a"].to_list() == [2, 3]
+
+
 class TestPipelineErrorHandling:
     """Tests for error handling."""
     
@@ -3,17 +3,73 @@
 import pytest
 import polars as pl
 from pathlib import Path
-import tempfile
 import json
 
 from frameworks.data_transformation.engine.transformation_engine import TransformationEngine
-from frameworks.data_transformation.engine.transformation_context import TransformationContext
 from frameworks.data_transformation.contract.transformer import Transformer
-from frameworks.data_transformation.exceptions import (
-    PipelineNotFoundError,
-    ConfigurationError,
-    DatasetNotFoundError,
-)
+from frameworks.data_transformation.exceptions import PipelineNotFoundError
+
+
+# Keep this module on one xdist worker so it shares that worker's session engine
+pytestmark = pytest.mark.xdist_group("transformation_engine")
+
+EXPECTED_BUILTIN_TRANSFORMERS = frozenset({
+    "select", "drop", "rename", "cast", "with_columns",
+    "filter", "sort", "unique", "head", "tail", "slice", "sample", "drop_nulls",
+    "pivot", "unpivot", "explode",
+    "group_by",
+    "join", "concat", "union",
+    "fill_null", "fill_nan",
+})
+
+CUSTOMER_COLUMNS = ["customer_id", "name", "email", "status", "age", "signup_date"]
+
+METRICS_PIPELINES = {
+    "metrics_select_ids": {
+        "steps": [
+            {"name": "select", "type": "select", "config": {"columns": ["customer_id", "name"]}}
+        ]
+    },
+    "metrics_select_contact": {
+        "steps": [
+            {"name": "select", "type": "select", "config": {"columns": ["name", "email"]}}
+        ]
+    },
+    "metrics_filter_active": {
+        "steps": [
+            {"name": "filter", "type": "filter", "config": {"condition": "col('status') == 'active'"}}
+        ]
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def pipelines_config_path(tmp_path_factory) -> Path:
+    """Pipeline config file written once for the module."""
+    config = {
+        "pipelines": {
+            "test_pipeline": {
+                "steps": [
+                    {"name": "select_cols", "type": "select", "config": {"columns": ["name"]}}
+                ]
+            }
+        }
+    }
+    config_path = tmp_path_factory.mktemp("configs") / "pipelines.json"
+    config_path.write_text(json.dumps(config))
+    return config_path
+
+
+@pytest.fixture(scope="module")
+def metrics_pipelines(transformation_engine):
+    """Register the single-step metrics pipelines once for the module."""
+    for pipeline_id, pipeline_config in METRICS_PIPELINES.items():
+        transformation_engine.add_pipeline(pipeline_id, pipeline_config)
+    
+    yield list(METRICS_PIPELINES)
+    
+    for pipeline_id in METRICS_PIPELINES:
+        transformation_engine._pipelines.pop(pipeline_id, None)
 
 
 class TestTransformationEngineInit:
@@ -30,34 +86,12 @@ class TestTransformationEngineInit:
         """Test that all built-in transformers are registered."""
         engine = TransformationEngine()
         
-        expected_transformers = [
-            "select", "drop", "rename", "cast", "with_columns",
-            "filter", "sort", "unique", "head", "tail", "slice", "sample", "drop_nulls",
-            "pivot", "unpivot", "explode",
-            "group_by",
-            "join", "concat", "union",
-            "fill_null", "fill_nan",
-        ]
-        
-        registered = engine.list_transformers()
-        for transformer in expected_transformers:
-            assert transformer in registered, f"Missing transformer: {transformer}"
+        missing = EXPECTED_BUILTIN_TRANSFORMERS - set(engine.list_transformers())
+        assert not missing, f"Missing transformers: {sorted(missing)}"
     
-    def test_engine_loads_config_from_file(self, tmp_path):
+    def test_engine_loads_config_from_file(self, pipelines_config_path):
         """Test engine loads pipeline config from JSON file."""
-        config = {
-            "pipelines": {
-                "test_pipeline": {
-                    "steps": [
-                        {"name": "select_cols", "type": "select", "config": {"columns": ["name"]}}
-                    ]
-                }
-            }
-        }
-        config_path = tmp_path / "pipelines.json"
-        config_path.write_text(json.dumps(config))
-        
-        engine = TransformationEngine(pipeline_config_path=config_path)
+        engine = TransformationEngine(pipeline_config_path=pipelines_config_path)
         
         assert "test_pipeline" in engine.list_pipelines()
 
@@ -116,29 +150,6 @@ class TestTransformationEnginePipelineManagement:
 class TestTransformationEngineExecution:
     """Tests for pipeline execution."""
     
-    def test_transform_simple_pipeline(
-        self, 
-        transformation_engine, 
-        sample_customers_df,
-    ):
-        """Test executing a simple single-step pipeline."""
-        transformation_engine.add_pipeline("select_pipeline", {
-            "steps": [
-                {"name": "select_cols", "type": "select", "config": {"columns": ["customer_id", "name"]}}
-            ]
-        })
-        
-        result = transformation_engine.transform(
-            pipeline_id="select_pipeline",
-            data=sample_customers_df,
-        )
-        
-        assert result.success is True
-        assert result.data is not None
-        assert result.data.columns == ["customer_id", "name"]
-        assert result.rows_in == 5
-        assert result.rows_out == 5
-    
     def test_transform_multi_step_pipeline(
         self, 
         transformation_engine, 
@@ -272,68 +283,56 @@ class TestTransformationEngineExecution:
 class TestTransformationEngineErrorHandling:
     """Tests for error handling in pipeline execution."""
     
-    def test_transform_step_failure_stops_pipeline(
+    @pytest.mark.parametrize(
+        "steps,expected_error,expected_step_count",
+        [
+            pytest.param(
+                [
+                    {"name": "select_valid", "type": "select", "config": {"columns": ["name"]}},
+                    {"name": "select_invalid", "type": "select", "config": {"columns": ["nonexistent"]}},
+                    {"name": "never_reached", "type": "select", "config": {"columns": ["name"]}},
+                ],
+                None,
+                2,  # First two steps only
+                id="step_failure_stops_pipeline",
+            ),
+            pytest.param(
+                [{"name": "unknown", "type": "nonexistent_transformer", "config": {}}],
+                "nonexistent_transformer",
+                1,
+                id="invalid_transformer_type",
+            ),
+            pytest.param(
+                [{"name": "select_no_columns", "type": "select", "config": {}}],  # Missing required 'columns'
+                "columns",
+                1,
+                id="config_validation_failure",
+            ),
+        ],
+    )
+    def test_transform_error_paths(
         self, 
+        request,
         transformation_engine, 
         sample_customers_df,
+        steps,
+        expected_error,
+        expected_step_count,
     ):
-        """Test that step failure stops pipeline and returns error result."""
-        transformation_engine.add_pipeline("failing_pipeline", {
-            "steps": [
-                {"name": "select_valid", "type": "select", "config": {"columns": ["name"]}},
-                {"name": "select_invalid", "type": "select", "config": {"columns": ["nonexistent"]}},
-                {"name": "never_reached", "type": "select", "config": {"columns": ["name"]}},
-            ]
-        })
+        """Test that a failing step stops the pipeline and returns an error result."""
+        pipeline_id = f"err_{request.node.callspec.id}"
+        transformation_engine.add_pipeline(pipeline_id, {"steps": steps})
         
         result = transformation_engine.transform(
-            pipeline_id="failing_pipeline",
+            pipeline_id=pipeline_id,
             data=sample_customers_df,
         )
         
         assert result.success is False
         assert result.error_message is not None
-        assert len(result.step_results) == 2  # First two steps only
-    
-    def test_transform_invalid_transformer_type(
-        self, 
-        transformation_engine, 
-        sample_customers_df,
-    ):
-        """Test that unknown transformer type fails gracefully."""
-        transformation_engine.add_pipeline("invalid_type_pipeline", {
-            "steps": [
-                {"name": "unknown", "type": "nonexistent_transformer", "config": {}}
-            ]
-        })
-        
-        result = transformation_engine.transform(
-            pipeline_id="invalid_type_pipeline",
-            data=sample_customers_df,
-        )
-        
-        assert result.success is False
-        assert "nonexistent_transformer" in result.error_message
-    
-    def test_transform_config_validation_failure(
-        self, 
-        transformation_engine, 
-        sample_customers_df,
-    ):
-        """Test that config validation failures are handled."""
-        transformation_engine.add_pipeline("invalid_config_pipeline", {
-            "steps": [
-                {"name": "select_no_columns", "type": "select", "config": {}}  # Missing required 'columns'
-            ]
-        })
-        
-        result = transformation_engine.transform(
-            pipeline_id="invalid_config_pipeline",
-            data=sample_customers_df,
-        )
-        
-        assert result.success is False
-        assert "columns" in result.error_message.lower()
+        assert len(result.step_results) == expected_step_count
+        if expected_error is not None:
+            assert expected_error in result.error_message.lower()
 
 
 class TestTransformationEngineCustomTransformers:
@@ -342,12 +341,14 @@ class TestTransformationEngineCustomTransformers:
     def test_register_custom_transformer(self, transformation_engine):
         """Test registering a custom transformer."""
         class CustomTransformer(Transformer):
+            _expr = pl.lit("custom").alias("custom_col")
+            
             @property
             def transformer_type(self) -> str:
                 return "custom"
             
             def transform(self, data, context):
-                return data.with_columns(pl.lit("custom").alias("custom_col"))
+                return data.with_columns(self._expr)
             
             def validate_config(self, config):
                 return None
@@ -366,15 +367,16 @@ class TestTransformationEngineCustomTransformers:
             def __init__(self, name: str, config: dict):
                 self.name = name
                 self.config = config
+                self._expr = pl.lit(config.get("value", "default")).alias(
+                    config.get("column_name", "constant")
+                )
             
             @property
             def transformer_type(self) -> str:
                 return "add_constant"
             
             def transform(self, data, context):
-                value = self.config.get("value", "default")
-                column_name = self.config.get("column_name", "constant")
-                return data.with_columns(pl.lit(value).alias(column_name))
+                return data.with_columns(self._expr)
             
             def validate_config(self, config):
                 return None
@@ -399,67 +401,39 @@ class TestTransformationEngineCustomTransformers:
 class TestTransformationResultMetrics:
     """Tests for transformation result metrics."""
     
-    def test_result_includes_timing(
+    @pytest.mark.parametrize(
+        "pipeline_id,expected_columns,expected_rows_out",
+        [
+            ("metrics_select_ids", ["customer_id", "name"], 5),
+            ("metrics_select_contact", ["name", "email"], 5),
+            ("metrics_filter_active", CUSTOMER_COLUMNS, 3),  # 3 active customers
+        ],
+    )
+    def test_result_metrics(
         self, 
         transformation_engine, 
+        metrics_pipelines,
         sample_customers_df,
+        pipeline_id,
+        expected_columns,
+        expected_rows_out,
     ):
-        """Test that results include execution timing."""
-        transformation_engine.add_pipeline("timed_pipeline", {
-            "steps": [
-                {"name": "select", "type": "select", "config": {"columns": ["name"]}}
-            ]
-        })
-        
+        """Test that results include data, timing, row counts and column counts."""
         result = transformation_engine.transform(
-            pipeline_id="timed_pipeline",
+            pipeline_id=pipeline_id,
             data=sample_customers_df,
         )
         
+        assert result.success is True
+        assert result.data is not None
+        assert result.data.columns == expected_columns
         assert result.total_execution_time_ms > 0
-        assert result.step_results[0].execution_time_ms >= 0
-    
-    def test_result_includes_row_counts(
-        self, 
-        transformation_engine, 
-        sample_customers_df,
-    ):
-        """Test that results include row counts."""
-        transformation_engine.add_pipeline("filter_pipeline", {
-            "steps": [
-                {"name": "filter", "type": "filter", "config": {"condition": "col('status') == 'active'"}}
-            ]
-        })
-        
-        result = transformation_engine.transform(
-            pipeline_id="filter_pipeline",
-            data=sample_customers_df,
-        )
-        
         assert result.rows_in == 5
-        assert result.rows_out == 3  # 3 active customers
+        assert result.rows_out == expected_rows_out
         
         step_result = result.step_results[0]
+        assert step_result.execution_time_ms >= 0
         assert step_result.rows_in == 5
-        assert step_result.rows_out == 3
-    
-    def test_result_includes_column_counts(
-        self, 
-        transformation_engine, 
-        sample_customers_df,
-    ):
-        """Test that results include column counts."""
-        transformation_engine.add_pipeline("select_pipeline", {
-            "steps": [
-                {"name": "select", "type": "select", "config": {"columns": ["name", "email"]}}
-            ]
-        })
-        
-        result = transformation_engine.transform(
-            pipeline_id="select_pipeline",
-            data=sample_customers_df,
-        )
-        
-        step_result = result.step_results[0]
+        assert step_result.rows_out == expected_rows_out
         assert step_result.columns_in == 6  # Original columns
-        assert step_result.columns_out == 2  # Selected columns
+        assert step_result.columns_out == len(expected_columns)
@@ -8,13 +8,38 @@ from frameworks.data_transformation.engine.transformation_context import Transfo
 from frameworks.data_transformation.exceptions import ConfigurationError
 
 
+def grp(result: pl.DataFrame, key_col: str, key, val_col: str):
+    """Return val_col for the group whose key_col equals key."""
+    return dict(zip(result[key_col].to_list(), result[val_col].to_list()))[key]
+
+
+# Frames built once at import; tests only read them.
+_GROUP_SCHEMA = {"group": pl.Utf8, "value": pl.Int64}
+
+_NUMERIC_DF = pl.DataFrame(
+    {"group": ["A", "A", "A", "B", "B"], "value": [10, 20, 30, 40, 50]},
+    schema=_GROUP_SCHEMA,
+)
+
+_SINGLE_GROUP_DF = pl.DataFrame(
+    {"group": ["A", "A", "A"], "value": [1, 2, 3]},
+    schema=_GROUP_SCHEMA,
+)
+
+_EMPTY_DF = pl.DataFrame(schema=_GROUP_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def numeric_df() -> pl.DataFrame:
+    """DataFrame with numeric data for testing aggregations (read-only)."""
+    return _NUMERIC_DF
+
+
 class TestGroupByTransformerBasic:
     """Basic tests for GroupByTransformer."""
     
-    def test_group_by_single_column_count(self, sample_orders_df, empty_context):
+    def test_group_by_single_column_count(self, sample_orders_df, orders_context):
         """Test group by single column with count aggregation."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="group_by_customer",
             config={
@@ -25,18 +50,16 @@ class TestGroupByTransformerBasic:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         assert "customer_id" in result.columns
         assert "order_count" in result.columns
         # Customer 1 has 3 orders
-        customer_1_count = result.filter(pl.col("customer_id") == 1)["order_count"][0]
+        customer_1_count = grp(result, "customer_id", 1, "order_count")
         assert customer_1_count == 3
     
-    def test_group_by_sum(self, sample_orders_df, empty_context):
+    def test_group_by_sum(self, sample_orders_df, orders_context):
         """Test group by with sum aggregation."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="group_by_sum",
             config={
@@ -47,16 +70,14 @@ class TestGroupByTransformerBasic:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         # Customer 1 has orders: 100 + 150 + 300 = 550
-        customer_1_total = result.filter(pl.col("customer_id") == 1)["total_amount"][0]
+        customer_1_total = grp(result, "customer_id", 1, "total_amount")
         assert customer_1_total == 550.0
     
-    def test_group_by_mean(self, sample_orders_df, empty_context):
+    def test_group_by_mean(self, sample_orders_df, orders_context):
         """Test group by with mean aggregation."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="group_by_mean",
             config={
@@ -67,16 +88,14 @@ class TestGroupByTransformerBasic:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         # Customer 1: (100 + 150 + 300) / 3 = 183.33...
-        customer_1_avg = result.filter(pl.col("customer_id") == 1)["avg_amount"][0]
+        customer_1_avg = grp(result, "customer_id", 1, "avg_amount")
         assert abs(customer_1_avg - 183.33) < 0.5
     
-    def test_group_by_min_max(self, sample_orders_df, empty_context):
+    def test_group_by_min_max(self, sample_orders_df, orders_context):
         """Test group by with min and max aggregations."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="group_by_minmax",
             config={
@@ -88,20 +107,17 @@ class TestGroupByTransformerBasic:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
-        customer_1 = result.filter(pl.col("customer_id") == 1)
-        assert customer_1["min_amount"][0] == 100.0
-        assert customer_1["max_amount"][0] == 300.0
+        assert grp(result, "customer_id", 1, "min_amount") == 100.0
+        assert grp(result, "customer_id", 1, "max_amount") == 300.0
 
 
 class TestGroupByTransformerMultipleColumns:
     """Tests for grouping by multiple columns."""
     
-    def test_group_by_multiple_columns(self, sample_orders_df, empty_context):
+    def test_group_by_multiple_columns(self, sample_orders_df, orders_context):
         """Test group by multiple columns."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="group_by_multi",
             config={
@@ -113,7 +129,7 @@ class TestGroupByTransformerMultipleColumns:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         assert "customer_id" in result.columns
         assert "status" in result.columns
@@ -121,11 +137,9 @@ class TestGroupByTransformerMultipleColumns:
         assert "total" in result.columns
     
     def test_group_by_string_column_converts_to_list(
-        self, sample_orders_df, empty_context
+        self, sample_orders_df, orders_context
     ):
         """Test that string 'by' is converted to list."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="group_by_string",
             config={
@@ -136,7 +150,7 @@ class TestGroupByTransformerMultipleColumns:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         # Should work without error
         assert "customer_id" in result.columns
@@ -145,10 +159,8 @@ class TestGroupByTransformerMultipleColumns:
 class TestGroupByTransformerAggregationSpecs:
     """Tests for different aggregation specifications."""
     
-    def test_aggregation_dict_spec(self, sample_orders_df, empty_context):
+    def test_aggregation_dict_spec(self, sample_orders_df, orders_context):
         """Test aggregation with dict specification."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="dict_spec",
             config={
@@ -159,14 +171,12 @@ class TestGroupByTransformerAggregationSpecs:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         assert "total" in result.columns
     
-    def test_aggregation_shorthand_spec(self, sample_orders_df, empty_context):
+    def test_aggregation_shorthand_spec(self):
         """Test aggregation with shorthand specification."""
-        context = TransformationContext(data=sample_orders_df)
-        
         # Create a DataFrame where the output column name matches the aggregation
         df = pl.DataFrame({
             "category": ["A", "A", "B", "B"],
@@ -188,13 +198,11 @@ class TestGroupByTransformerAggregationSpecs:
         
         assert "count" in result.columns
         # A: 1+2=3, B: 3+4=7
-        a_sum = result.filter(pl.col("category") == "A")["count"][0]
+        a_sum = grp(result, "category", "A", "count")
         assert a_sum == 3
     
-    def test_aggregation_expression_spec(self, sample_orders_df, empty_context):
+    def test_aggregation_expression_spec(self, sample_orders_df, orders_context):
         """Test aggregation with expression string specification."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="expr_spec",
             config={
@@ -205,16 +213,14 @@ class TestGroupByTransformerAggregationSpecs:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         assert "total_amount" in result.columns
-        customer_1 = result.filter(pl.col("customer_id") == 1)["total_amount"][0]
+        customer_1 = grp(result, "customer_id", 1, "total_amount")
         assert customer_1 == 550.0
     
-    def test_aggregation_polars_expression(self, sample_orders_df, empty_context):
+    def test_aggregation_polars_expression(self, sample_orders_df, orders_context):
         """Test aggregation with Polars expression object."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="polars_expr",
             config={
@@ -225,115 +231,77 @@ class TestGroupByTransformerAggregationSpecs:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         assert "double_sum" in result.columns
-        customer_1 = result.filter(pl.col("customer_id") == 1)["double_sum"][0]
+        customer_1 = grp(result, "customer_id", 1, "double_sum")
         assert customer_1 == 1100.0  # 550 * 2
-
-
-class TestGroupByTransformerAllAggregations:
-    """Tests for all supported aggregation functions."""
-    
-    @pytest.fixture
-    def numeric_df(self):
-        """DataFrame with numeric data for testing aggregations."""
-        return pl.DataFrame({
-            "group": ["A", "A", "A", "B", "B"],
-            "value": [10, 20, 30, 40, 50],
-        })
-    
-    def test_sum_aggregation(self, numeric_df):
-        """Test sum aggregation."""
-        context = TransformationContext(data=numeric_df)
-        transformer = GroupByTransformer(
-            name="test",
-            config={
-                "by": "group",
-                "aggregations": {"result": {"column": "value", "agg": "sum"}}
-            }
-        )
-        
-        result = transformer.transform(numeric_df, context)
-        a_result = result.filter(pl.col("group") == "A")["result"][0]
-        assert a_result == 60  # 10 + 20 + 30
     
-    def test_mean_aggregation(self, numeric_df):
-        """Test mean aggregation."""
-        context = TransformationContext(data=numeric_df)
+    def test_transformer_reused_across_calls(self, sample_orders_df, orders_context):
+        """Test that one transformer instance aggregates repeatedly."""
         transformer = GroupByTransformer(
-            name="test",
+            name="reused",
             config={
-                "by": "group",
-                "aggregations": {"result": {"column": "value", "agg": "mean"}}
-            }
-        )
-        
-        result = transformer.transform(numeric_df, context)
-        a_result = result.filter(pl.col("group") == "A")["result"][0]
-        assert a_result == 20.0  # (10 + 20 + 30) / 3
-    
-    def test_avg_aggregation_alias(self, numeric_df):
-        """Test avg aggregation (alias for mean)."""
-        context = TransformationContext(data=numeric_df)
-        transformer = GroupByTransformer(
-            name="test",
-            config={
-                "by": "group",
-                "aggregations": {"result": {"column": "value", "agg": "avg"}}
+                "by": "customer_id",
+                "aggregations": {
+                    "total": {"column": "amount", "agg": "sum"},
+                    "amount": "max",
+                    "doubled": "col('amount').sum() * 2",
+                    "orders": pl.col("order_id").count(),
+                }
             }
         )
         
-        result = transformer.transform(numeric_df, context)
-        a_result = result.filter(pl.col("group") == "A")["result"][0]
-        assert a_result == 20.0
-    
-    def test_min_aggregation(self, numeric_df):
-        """Test min aggregation."""
-        context = TransformationContext(data=numeric_df)
-        transformer = GroupByTransformer(
-            name="test",
-            config={
-                "by": "group",
-                "aggregations": {"result": {"column": "value", "agg": "min"}}
-            }
-        )
+        first = transformer.transform(sample_orders_df, orders_context)
+        second = transformer.transform(sample_orders_df.head(2), orders_context)
         
-        result = transformer.transform(numeric_df, context)
-        a_result = result.filter(pl.col("group") == "A")["result"][0]
-        assert a_result == 10
+        assert grp(first, "customer_id", 1, "total") == 550.0
+        assert grp(first, "customer_id", 1, "amount") == 300.0
+        assert grp(first, "customer_id", 1, "doubled") == 1100.0
+        assert grp(first, "customer_id", 1, "orders") == 3
+        assert second["customer_id"].to_list() == [1]
+        assert grp(second, "customer_id", 1, "total") == 250.0
+
+
+class TestGroupByTransformerAllAggregations:
+    """Tests for all supported aggregation functions."""
     
-    def test_max_aggregation(self, numeric_df):
-        """Test max aggregation."""
+    def test_all_aggs_in_one_pass(self, numeric_df):
+        """Test every aggregation function in a single group_by call."""
         context = TransformationContext(data=numeric_df)
         transformer = GroupByTransformer(
             name="test",
             config={
                 "by": "group",
-                "aggregations": {"result": {"column": "value", "agg": "max"}}
+                "aggregations": {
+                    "s": {"column": "value", "agg": "sum"},
+                    "m": {"column": "value", "agg": "mean"},
+                    "a": {"column": "value", "agg": "avg"},
+                    "lo": {"column": "value", "agg": "min"},
+                    "hi": {"column": "value", "agg": "max"},
+                    "c": {"column": "value", "agg": "count"},
+                    "f": {"column": "value", "agg": "first"},
+                    "l": {"column": "value", "agg": "last"},
+                },
+                "maintain_order": True,
             }
         )
         
         result = transformer.transform(numeric_df, context)
-        a_result = result.filter(pl.col("group") == "A")["result"][0]
-        assert a_result == 30
-    
-    def test_count_aggregation(self, numeric_df):
-        """Test count aggregation."""
-        context = TransformationContext(data=numeric_df)
-        transformer = GroupByTransformer(
-            name="test",
-            config={
-                "by": "group",
-                "aggregations": {"result": {"column": "value", "agg": "count"}}
-            }
-        )
         
-        result = transformer.transform(numeric_df, context)
-        a_result = result.filter(pl.col("group") == "A")["result"][0]
-        assert a_result == 3
+        assert result.row(by_predicate=pl.col("group") == "A", named=True) == {
+            "group": "A",
+            "s": 60,  # 10 + 20 + 30
+            "m": 20.0,  # (10 + 20 + 30) / 3
+            "a": 20.0,  # avg is an alias for mean
+            "lo": 10,
+            "hi": 30,
+            "c": 3,
+            "f": 10,
+            "l": 30,
+        }
     
-    def test_n_unique_aggregation(self, numeric_df):
+    def test_n_unique_aggregation(self):
         """Test n_unique aggregation."""
         # Add duplicate values
         df = pl.DataFrame({
@@ -351,143 +319,95 @@ class TestGroupByTransformerAllAggregations:
         )
         
         result = transformer.transform(df, context)
-        a_result = result.filter(pl.col("group") == "A")["result"][0]
+        a_result = grp(result, "group", "A", "result")
         assert a_result == 2
-    
-    def test_first_aggregation(self, numeric_df):
-        """Test first aggregation."""
-        context = TransformationContext(data=numeric_df)
-        transformer = GroupByTransformer(
-            name="test",
-            config={
-                "by": "group",
-                "aggregations": {"result": {"column": "value", "agg": "first"}},
-                "maintain_order": True,
-            }
-        )
-        
-        result = transformer.transform(numeric_df, context)
-        a_result = result.filter(pl.col("group") == "A")["result"][0]
-        assert a_result == 10  # First value in group A
-    
-    def test_last_aggregation(self, numeric_df):
-        """Test last aggregation."""
-        context = TransformationContext(data=numeric_df)
-        transformer = GroupByTransformer(
-            name="test",
-            config={
-                "by": "group",
-                "aggregations": {"result": {"column": "value", "agg": "last"}},
-                "maintain_order": True,
-            }
-        )
-        
-        result = transformer.transform(numeric_df, context)
-        a_result = result.filter(pl.col("group") == "A")["result"][0]
-        assert a_result == 30  # Last value in group A
 
 
 class TestGroupByTransformerValidation:
     """Tests for configuration validation."""
     
-    def test_validate_missing_by(self):
-        """Test validation catches missing 'by'."""
-        transformer = GroupByTransformer(
-            name="test",
-            config={"aggregations": {}}
-        )
-        
-        error = transformer.validate_config({"aggregations": {}})
-        
-        assert error is not None
-        assert "by" in error.lower()
-    
-    def test_validate_missing_aggregations(self):
-        """Test validation catches missing 'aggregations'."""
-        transformer = GroupByTransformer(
-            name="test",
-            config={"by": "column"}
-        )
-        
-        error = transformer.validate_config({"by": "column"})
-        
-        assert error is not None
-        assert "aggregations" in error.lower()
-    
-    def test_validate_aggregations_not_dict(self):
-        """Test validation catches non-dict aggregations."""
-        transformer = GroupByTransformer(
-            name="test",
-            config={"by": "column", "aggregations": ["sum"]}
-        )
-        
-        error = transformer.validate_config({"by": "column", "aggregations": ["sum"]})
-        
-        assert error is not None
-        assert "dictionary" in error.lower()
-    
-    def test_validate_valid_config(self):
-        """Test validation passes with valid config."""
-        config = {
-            "by": "customer_id",
-            "aggregations": {
-                "total": {"column": "amount", "agg": "sum"}
-            }
-        }
-        transformer = GroupByTransformer(name="test", config=config)
-        
-        error = transformer.validate_config(config)
-        
-        assert error is None
-    
-    def test_invalid_aggregation_function_raises_error(
-        self, sample_orders_df, empty_context
-    ):
+    @pytest.mark.parametrize(
+        "cfg,expected_substr",
+        [
+            pytest.param({"aggregations": {}}, "by", id="missing_by"),
+            pytest.param({"by": "column"}, "aggregations", id="missing_aggregations"),
+            pytest.param(
+                {"by": "column", "aggregations": ["sum"]},
+                "dictionary",
+                id="aggregations_not_dict",
+            ),
+            pytest.param(
+                {
+                    "by": "customer_id",
+                    "aggregations": {"total": {"column": "amount", "agg": "sum"}},
+                },
+                None,
+                id="valid_config",
+            ),
+        ],
+    )
+    def test_validate_config(self, cfg, expected_substr):
+        """Test validation of required keys and the aggregations type."""
+        error = GroupByTransformer.validate_config(cfg)
+        
+        assert (error is None) == (expected_substr is None)
+        if expected_substr:
+            assert expected_substr in error.lower()
+    
+    def test_invalid_aggregation_function_raises_error(self):
         """Test that invalid aggregation function raises error."""
-        context = TransformationContext(data=sample_orders_df)
-        
-        transformer = GroupByTransformer(
-            name="invalid_agg",
-            config={
-                "by": "customer_id",
+        with pytest.raises(ConfigurationError) as exc_info:
+            GroupByTransformer._compile_aggregations({
                 "aggregations": {
                     "result": {"column": "amount", "agg": "nonexistent_agg"}
                 }
-            }
-        )
-        
-        with pytest.raises(ConfigurationError) as exc_info:
-            transformer.transform(sample_orders_df, context)
+            })
         
         assert "nonexistent_agg" in str(exc_info.value).lower()
     
-    def test_invalid_dict_aggregation_missing_column(
-        self, sample_orders_df, empty_context
-    ):
+    def test_invalid_dict_aggregation_missing_column(self):
         """Test that dict aggregation without column raises error."""
-        context = TransformationContext(data=sample_orders_df)
-        
+        with pytest.raises(ConfigurationError):
+            GroupByTransformer._compile_aggregations({
+                "aggregations": {
+                    "result": {"agg": "sum"}  # Missing 'column'
+                }
+            })
+    
+    def test_invalid_aggregation_raises_on_transform(
+        self, sample_orders_df, orders_context
+    ):
+        """Test that transform surfaces aggregation config errors."""
         transformer = GroupByTransformer(
-            name="missing_column",
+            name="invalid_agg",
             config={
                 "by": "customer_id",
                 "aggregations": {
-                    "result": {"agg": "sum"}  # Missing 'column'
+                    "result": {"column": "amount", "agg": "nonexistent_agg"}
                 }
             }
         )
         
         with pytest.raises(ConfigurationError):
-            transformer.transform(sample_orders_df, context)
+            transformer.transform(sample_orders_df, orders_context)
+    
+    def test_compile_aggregations_returns_aliased_exprs(self):
+        """Test that compiled expressions carry the output column names."""
+        exprs = GroupByTransformer._compile_aggregations({
+            "aggregations": {
+                "total": {"column": "amount", "agg": "sum"},
+                "amount": "max",
+            }
+        })
+        
+        assert [expr.meta.output_name() for expr in exprs] == ["total", "amount"]
 
 
 class TestGroupByTransformerMaintainOrder:
     """Tests for maintain_order option."""
     
-    def test_maintain_order_true(self, sample_orders_df, empty_context):
+    def test_maintain_order_true(self, sample_orders_df, orders_context):
         """Test maintain_order=True preserves group order."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="maintain_order",
             config={
@@ -499,16 +419,14 @@ class TestGroupByTransformerMaintainOrder:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         # First customer in original should be first in result
         first_customer = sample_orders_df["customer_id"][0]
         assert result["customer_id"][0] == first_customer
     
-    def test_maintain_order_default_true(self, sample_orders_df, empty_context):
+    def test_maintain_order_default_true(self, sample_orders_df, orders_context):
         """Test that maintain_order defaults to True."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="default_order",
             config={
@@ -520,7 +438,7 @@ class TestGroupByTransformerMaintainOrder:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         # Should maintain order by default
         first_customer = sample_orders_df["customer_id"][0]
@@ -543,14 +461,9 @@ class TestGroupByTransformerProperties:
 class TestGroupByTransformerEdgeCases:
     """Tests for edge cases."""
     
-    def test_group_by_empty_dataframe(self, empty_context):
+    def test_group_by_empty_dataframe(self):
         """Test group by on empty DataFrame."""
-        empty_df = pl.DataFrame({
-            "group": [],
-            "value": [],
-        }).cast({"group": pl.Utf8, "value": pl.Int64})
-        
-        context = TransformationContext(data=empty_df)
+        context = TransformationContext(data=_EMPTY_DF)
         
         transformer = GroupByTransformer(
             name="empty_group",
@@ -562,17 +475,13 @@ class TestGroupByTransformerEdgeCases:
             }
         )
         
-        result = transformer.transform(empty_df, context)
+        result = transformer.transform(_EMPTY_DF, context)
         
         assert len(result) == 0
     
-    def test_group_by_single_group(self, empty_context):
+    def test_group_by_single_group(self):
         """Test group by with single group."""
-        df = pl.DataFrame({
-            "group": ["A", "A", "A"],
-            "value": [1, 2, 3],
-        })
-        context = TransformationContext(data=df)
+        context = TransformationContext(data=_SINGLE_GROUP_DF)
         
         transformer = GroupByTransformer(
             name="single_group",
@@ -584,15 +493,13 @@ class TestGroupByTransformerEdgeCases:
             }
         )
         
-        result = transformer.transform(df, context)
+        result = transformer.transform(_SINGLE_GROUP_DF, context)
         
         assert len(result) == 1
         assert result["sum"][0] == 6
     
-    def test_multiple_aggregations_same_column(self, sample_orders_df, empty_context):
+    def test_multiple_aggregations_same_column(self, sample_orders_df, orders_context):
         """Test multiple aggregations on the same column."""
-        context = TransformationContext(data=sample_orders_df)
-        
         transformer = GroupByTransformer(
             name="multi_agg",
             config={
@@ -607,7 +514,7 @@ class TestGroupByTransformerEdgeCases:
             }
         )
         
-        result = transformer.transform(sample_orders_df, context)
+        result = transformer.transform(sample_orders_df, orders_context)
         
         assert "total" in result.columns
         assert "average" in result.columns
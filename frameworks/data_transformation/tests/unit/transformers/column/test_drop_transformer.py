@@ -4,7 +4,6 @@ import pytest
 import polars as pl
 
 from frameworks.data_transformation.transformers.column.drop import DropTransformer
-from frameworks.data_transformation.engine.transformation_context import TransformationContext
 
 
 class TestDropTransformer:
@@ -50,6 +49,29 @@ class TestDropTransformer:
         assert "name" in result.columns
         assert "age" in result.columns
     
+    def test_drop_lazy_frame(self, sample_customers_df, empty_context):
+        """Test that a LazyFrame input stays lazy."""
+        transformer = DropTransformer(
+            name="drop_email",
+            config={"columns": ["email"]}
+        )
+        
+        result = transformer.transform(sample_customers_df.lazy(), empty_context)
+        
+        assert isinstance(result, pl.LazyFrame)
+        assert "email" not in result.collect().columns
+    
+    def test_drop_empty_columns(self, sample_customers_df, empty_context):
+        """Test dropping an empty column list (no-op)."""
+        transformer = DropTransformer(
+            name="no_op",
+            config={"columns": []}
+        )
+        
+        result = transformer.transform(sample_customers_df, empty_context)
+        
+        assert result is sample_customers_df
+    
     def test_drop_nonexistent_column_raises_error(
         self, sample_customers_df, empty_context
     ):
@@ -59,7 +81,7 @@ class TestDropTransformer:
             config={"columns": ["nonexistent"]}
         )
         
-        with pytest.raises(Exception):  # Polars will raise
+        with pytest.raises(pl.exceptions.ColumnNotFoundError, match="nonexistent"):
             transformer.transform(sample_customers_df, empty_context)
     
     def test_validate_config_missing_columns(self):
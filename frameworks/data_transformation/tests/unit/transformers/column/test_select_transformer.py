@@ -4,7 +4,6 @@ import pytest
 import polars as pl
 
 from frameworks.data_transformation.transformers.column.select import SelectTransformer
-from frameworks.data_transformation.engine.transformation_context import TransformationContext
 
 
 class TestSelectTransformer:
@@ -45,6 +44,18 @@ class TestSelectTransformer:
         
         assert result.columns == ["email", "name", "customer_id"]
     
+    def test_select_lazy_frame(self, sample_customers_df, empty_context):
+        """Test that a LazyFrame input stays lazy."""
+        transformer = SelectTransformer(
+            name="select_cols",
+            config={"columns": ["name", "customer_id"]}
+        )
+        
+        result = transformer.transform(sample_customers_df.lazy(), empty_context)
+        
+        assert isinstance(result, pl.LazyFrame)
+        assert result.collect().columns == ["name", "customer_id"]
+    
     def test_select_missing_column_raises_error(
         self, sample_customers_df, empty_context
     ):
@@ -54,7 +65,7 @@ class TestSelectTransformer:
             config={"columns": ["nonexistent"]}
         )
         
-        with pytest.raises(Exception):  # Polars will raise
+        with pytest.raises(pl.exceptions.ColumnNotFoundError, match="nonexistent"):
             transformer.transform(sample_customers_df, empty_context)
     
     def test_validate_config_missing_columns(self):
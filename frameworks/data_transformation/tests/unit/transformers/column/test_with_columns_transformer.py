@@ -1,9 +1,9 @@
 """Tests for WithColumnsTransformer."""
 
 import polars as pl
-import pytest
 
 from frameworks.data_transformation.transformers.column.with_columns import WithColumnsTransformer
+from frameworks.data_transformation.engine.expression_parser import ExpressionParser
 
 
 class TestWithColumnsTransformer:
@@ -41,8 +41,8 @@ class TestWithColumnsTransformer:
         
         assert "name_upper" in result.columns
         # Verify the values are uppercase
-        for i, name in enumerate(sample_customers_df["name"].to_list()):
-            assert result["name_upper"][i] == name.upper()
+        names = sample_customers_df["name"].to_list()
+        assert result["name_upper"].to_list() == [name.upper() for name in names]
 
     def test_add_computed_column(self, sample_orders_df, empty_context):
         """Test adding a computed column based on other columns."""
@@ -53,8 +53,8 @@ class TestWithColumnsTransformer:
         result = transformer.transform(sample_orders_df, empty_context)
         
         assert "doubled_amount" in result.columns
-        for i, amount in enumerate(sample_orders_df["amount"].to_list()):
-            assert result["doubled_amount"][i] == amount * 2
+        amounts = sample_orders_df["amount"].to_list()
+        assert result["doubled_amount"].to_list() == [amount * 2 for amount in amounts]
 
     def test_add_multiple_columns(self, sample_customers_df, empty_context):
         """Test adding multiple columns at once."""
@@ -85,8 +85,8 @@ class TestWithColumnsTransformer:
         # Same number of columns
         assert len(result.columns) == len(sample_customers_df.columns)
         # Name column should now be uppercase
-        for i, name in enumerate(sample_customers_df["name"].to_list()):
-            assert result["name"][i] == name.upper()
+        names = sample_customers_df["name"].to_list()
+        assert result["name"].to_list() == [name.upper() for name in names]
 
     def test_add_boolean_column(self, sample_orders_df, empty_context):
         """Test adding a column with boolean literal."""
@@ -97,7 +97,7 @@ class TestWithColumnsTransformer:
         result = transformer.transform(sample_orders_df, empty_context)
         
         assert "processed" in result.columns
-        assert all(result["processed"].to_list())
+        assert result["processed"].to_list() == [True] * len(result)
 
     def test_add_column_with_conditional_expression(self, sample_orders_df, empty_context):
         """Test adding a column with a conditional expression."""
@@ -113,9 +113,55 @@ class TestWithColumnsTransformer:
         
         assert "is_large_order" in result.columns
         # Check values are correctly computed
-        for i in range(len(result)):
-            expected = sample_orders_df["amount"][i] > 200
-            assert result["is_large_order"][i] == expected
+        amounts = sample_orders_df["amount"].to_list()
+        assert result["is_large_order"].to_list() == [amount > 200 for amount in amounts]
+
+    def test_lazy_frame(self, sample_orders_df, empty_context):
+        """Test that a LazyFrame input stays lazy."""
+        transformer = WithColumnsTransformer(
+            name="add_doubled_amount",
+            config={"columns": {"doubled_amount": "col('amount') * 2"}}
+        )
+        result = transformer.transform(sample_orders_df.lazy(), empty_context)
+        
+        assert isinstance(result, pl.LazyFrame)
+        amounts = sample_orders_df["amount"].to_list()
+        assert result.collect()["doubled_amount"].to_list() == [amount * 2 for amount in amounts]
+
+    def test_transformer_reused_across_calls(self, sample_orders_df, empty_context):
+        """Test that one transformer instance computes columns repeatedly."""
+        transformer = WithColumnsTransformer(
+            name="add_doubled_amount",
+            config={"columns": {"doubled_amount": "col('amount') * 2", "flag": True}}
+        )
+        
+        first = transformer.transform(sample_orders_df, empty_context)
+        second = transformer.transform(sample_orders_df.head(2), empty_context)
+        
+        doubled = [amount * 2 for amount in sample_orders_df["amount"].to_list()]
+        assert first["doubled_amount"].to_list() == doubled
+        assert second["doubled_amount"].to_list() == doubled[:2]
+        assert second["flag"].to_list() == [True, True]
+
+    def test_instances_share_parsed_expressions(self, sample_customers_df, empty_context):
+        """Test that a second transformer reuses the first one's parsed expression."""
+        source = "col('name').str.to_uppercase()"
+        first = WithColumnsTransformer(name="first", config={"columns": {"a": source}})
+        first.transform(sample_customers_df, empty_context)
+        cached = ExpressionParser._expression_cache[source]
+        
+        second = WithColumnsTransformer(name="second", config={"columns": {"b": source}})
+        result = second.transform(sample_customers_df, empty_context)
+        
+        assert ExpressionParser._expression_cache[source] is cached
+        assert result["b"].to_list() == [name.upper() for name in sample_customers_df["name"].to_list()]
+
+    def test_empty_columns(self, sample_customers_df, empty_context):
+        """Test with an empty columns mapping (no-op)."""
+        transformer = WithColumnsTransformer(name="no_op", config={"columns": {}})
+        result = transformer.transform(sample_customers_df, empty_context)
+        
+        assert result is sample_customers_df
 
     def test_empty_dataframe(self, empty_context):
         """Test with empty DataFrame."""
@@ -174,7 +220,7 @@ class TestWithColumnsTransformer:
         result = transformer.transform(sample_customers_df, empty_context)
         
         assert "nullable_field" in result.columns
-        assert all(v is None for v in result["nullable_field"].to_list())
+        assert result["nullable_field"].to_list() == [None] * len(result)
 
     def test_add_float_literal(self, sample_customers_df, empty_context):
         """Test adding a column with float literal."""
@@ -185,7 +231,7 @@ class TestWithColumnsTransformer:
         result = transformer.transform(sample_customers_df, empty_context)
         
         assert "rate" in result.columns
-        assert all(v == 0.15 for v in result["rate"].to_list())
+        assert result["rate"].to_list() == [0.15] * len(result)
 
     def test_column_with_polars_expr_object(self, sample_customers_df, empty_context):
         """Test adding a column using a Polars expression object directly."""
@@ -197,5 +243,5 @@ class TestWithColumnsTransformer:
         result = transformer.transform(sample_customers_df, empty_context)
         
         assert "customer_id_doubled" in result.columns
-        for i, id_val in enumerate(sample_customers_df["customer_id"].to_list()):
-            assert result["customer_id_doubled"][i] == id_val * 2
+        ids = sample_customers_df["customer_id"].to_list()
+        assert result["customer_id_doubled"].to_list() == [id_val * 2 for id_val in ids]
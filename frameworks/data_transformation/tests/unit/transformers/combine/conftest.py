@@ -0,0 +1,143 @@
+"""Fixtures shared by the combine transformer tests."""
+
+from datetime import date
+
+import pytest
+import polars as pl
+
+from frameworks.data_transformation.engine.transformation_context import TransformationContext
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _polars_warmup() -> None:
+    """
+    Run one trivial join before the combine tests.
+    
+    Polars starts its thread pool on the first parallel operation; doing
+    that here keeps the start-up cost out of the first test's timing.
+    """
+    pl.DataFrame({"a": [1]}).join(pl.DataFrame({"a": [1]}), on="a")
+
+
+# Extra customer rows with the same columns as sample_customers_df. Polars
+# frames are immutable, so each is built once per session. The dtypes are
+# given up front so no column has to be inferred from its values.
+
+_CUSTOMER_SCHEMA = {
+    "customer_id": pl.Int64,
+    "name": pl.Utf8,
+    "email": pl.Utf8,
+    "status": pl.Utf8,
+    "age": pl.Int64,
+    "signup_date": pl.Date,
+}
+
+
+@pytest.fixture(scope="session")
+def additional_customers_df() -> pl.DataFrame:
+    """Two additional customers (Frank and Grace)."""
+    return pl.DataFrame({
+        "customer_id": [6, 7],
+        "name": ["Frank", "Grace"],
+        "email": ["frank@test.com", "grace@test.com"],
+        "status": ["active", "inactive"],
+        "age": [33, 27],
+        "signup_date": [date(2023, 6, 1), date(2023, 6, 15)],
+    }, schema=_CUSTOMER_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def frank_df() -> pl.DataFrame:
+    """A single additional customer (Frank)."""
+    return pl.DataFrame({
+        "customer_id": [6],
+        "name": ["Frank"],
+        "email": ["frank@test.com"],
+        "status": ["active"],
+        "age": [33],
+        "signup_date": [date(2023, 6, 1)],
+    }, schema=_CUSTOMER_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def grace_df() -> pl.DataFrame:
+    """A single additional customer (Grace)."""
+    return pl.DataFrame({
+        "customer_id": [7],
+        "name": ["Grace"],
+        "email": ["grace@test.com"],
+        "status": ["inactive"],
+        "age": [27],
+        "signup_date": [date(2023, 6, 15)],
+    }, schema=_CUSTOMER_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def one_customer_df(sample_customers_df) -> pl.DataFrame:
+    """The first row of sample_customers_df."""
+    return sample_customers_df.head(1)
+
+
+@pytest.fixture(scope="session")
+def first_two_customers(sample_customers_df) -> pl.DataFrame:
+    """The first two rows of sample_customers_df (Alice and Bob)."""
+    return sample_customers_df.head(2)
+
+
+@pytest.fixture(scope="session")
+def partial_overlap_df() -> pl.DataFrame:
+    """Alice, who is already a sample customer, plus a new customer (Henry)."""
+    return pl.DataFrame({
+        "customer_id": [1, 8],
+        "name": ["Alice", "Henry"],
+        "email": ["alice@test.com", "henry@test.com"],
+        "status": ["active", "active"],
+        "age": [25, 29],
+        "signup_date": [date(2023, 1, 15), date(2023, 7, 1)],
+    }, schema=_CUSTOMER_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def id_value_df() -> pl.DataFrame:
+    """Three distinct id/value rows."""
+    return pl.DataFrame({
+        "id": [1, 2, 3],
+        "value": ["a", "b", "c"],
+    }, schema={"id": pl.Int64, "value": pl.Utf8})
+
+
+@pytest.fixture(scope="session")
+def empty_customers_df() -> pl.DataFrame:
+    """Zero-row frame with the customer columns."""
+    return pl.DataFrame(schema=_CUSTOMER_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def customer_context(
+    sample_customers_df,
+    additional_customers_df,
+    one_customer_df,
+    first_two_customers,
+    frank_df,
+    grace_df,
+    partial_overlap_df,
+    empty_customers_df,
+) -> TransformationContext:
+    """
+    Context over the sample customers with the customer-shaped frames above.
+    
+    Each test picks the datasets it combines through its config; the
+    transformers only read the context, so one instance serves them all.
+    """
+    return TransformationContext(
+        data=sample_customers_df,
+        datasets={
+            "additional": additional_customers_df,
+            "one": one_customer_df,
+            "duplicates": first_two_customers,
+            "frank": frank_df,
+            "grace": grace_df,
+            "partial": partial_overlap_df,
+            "empty": empty_customers_df,
+        },
+    )
@@ -8,6 +8,25 @@ from frameworks.data_transformation.engine.transformation_context import Transfo
 from frameworks.data_transformation.exceptions import TransformationError, ConfigurationError
 
 
+# Keep the concat and join modules on one xdist worker so they share its
+# session-scoped customer, order and product frames
+pytestmark = pytest.mark.xdist_group("polars_combine")
+
+
+@pytest.fixture(scope="class")
+def inner_join_transformer() -> JoinTransformer:
+    """
+    Inner join of the customers with the orders on customer_id.
+    
+    transform() only reads its config and arguments, so one instance is
+    shared by the tests of a class.
+    """
+    return JoinTransformer(
+        name="inner_join",
+        config={"right_dataset": "orders", "on": "customer_id", "how": "inner"},
+    )
+
+
 class TestJoinTransformerBasic:
     """Basic tests for JoinTransformer."""
     
@@ -16,25 +35,17 @@ class TestJoinTransformerBasic:
         sample_customers_df, 
         sample_orders_df,
         context_with_datasets,
+        inner_join_transformer,
     ):
         """Test inner join on a single column."""
-        transformer = JoinTransformer(
-            name="join_orders",
-            config={
-                "right_dataset": "orders",
-                "on": "customer_id",
-                "how": "inner",
-            }
-        )
-        
-        result = transformer.transform(sample_customers_df, context_with_datasets)
+        result = inner_join_transformer.transform(sample_customers_df, context_with_datasets)
         
         # Inner join should only include customers with orders
         assert "order_id" in result.columns
         assert "amount" in result.columns
         # All rows should have matching customer_id in both datasets
-        customer_ids = result["customer_id"].unique().to_list()
-        assert all(cid in [1, 2, 3, 4] for cid in customer_ids)  # Customers with orders
+        customers_with_orders = [1, 2, 3, 4]
+        assert result["customer_id"].is_in(customers_with_orders).all()
     
     def test_left_join_preserves_all_left_rows(
         self,
@@ -55,9 +66,9 @@ class TestJoinTransformerBasic:
         result = transformer.transform(sample_customers_df, context_with_datasets)
         
         # Should have all customer_ids from original
-        original_customer_ids = set(sample_customers_df["customer_id"].to_list())
-        result_customer_ids = set(result["customer_id"].to_list())
-        assert original_customer_ids == result_customer_ids
+        left_ids = sample_customers_df["customer_id"].unique().sort()
+        result_ids = result["customer_id"].unique().sort()
+        assert left_ids.equals(result_ids)
     
     def test_join_with_left_on_right_on(self, context_with_datasets):
         """Test join with different column names."""
@@ -98,19 +109,11 @@ class TestJoinTransformerBasic:
         self,
         sample_customers_df,
         context_with_datasets,
+        inner_join_transformer,
     ):
         """Test that duplicate columns get suffix."""
         # Both customers and orders have 'status' column
-        transformer = JoinTransformer(
-            name="join_with_suffix",
-            config={
-                "right_dataset": "orders",
-                "on": "customer_id",
-                "how": "inner",
-            }
-        )
-        
-        result = transformer.transform(sample_customers_df, context_with_datasets)
+        result = inner_join_transformer.transform(sample_customers_df, context_with_datasets)
         
         # Should have both status columns
         assert "status" in result.columns  # From left (customers)
@@ -132,44 +135,69 @@ class TestJoinTransformerBasic:
         
         assert "status" in result.columns
         assert "status_order" in result.columns
-
-
-class TestJoinTransformerJoinTypes:
-    """Tests for different join types."""
     
-    def test_inner_join(self, context_with_datasets, sample_customers_df):
-        """Test inner join only includes matching rows."""
+    def test_transformer_reused_across_calls(
+        self,
+        sample_customers_df,
+        context_with_datasets,
+        first_two_customers,
+    ):
+        """Test that one transformer instance can join repeatedly."""
         transformer = JoinTransformer(
-            name="inner_join",
-            config={
-                "right_dataset": "orders",
-                "on": "customer_id",
-                "how": "inner",
-            }
+            name="join_orders",
+            config={"right_dataset": "orders", "on": "customer_id", "how": "inner"}
         )
         
-        result = transformer.transform(sample_customers_df, context_with_datasets)
+        first = transformer.transform(sample_customers_df, context_with_datasets)
+        second = transformer.transform(first_two_customers, context_with_datasets)
         
-        # All rows should have non-null order data
-        assert not result["order_id"].is_null().any()
+        assert len(first) == 6
+        assert second["customer_id"].unique().sort().equals(pl.Series([1, 2]))
+
+
+class TestJoinTransformerJoinTypes:
+    """Tests for different join types."""
     
-    def test_left_join(self, context_with_datasets, sample_customers_df):
-        """Test left join includes all left rows."""
+    @pytest.mark.parametrize(
+        "how,expected_ids,unmatched_ids",
+        [
+            # Inner: only customers with orders, all with order data
+            pytest.param("inner", [1, 2, 3, 4], [], id="inner"),
+            # Left: every customer; Eve (5) has no orders so order_id is null
+            pytest.param("left", [1, 2, 3, 4, 5], [5], id="left"),
+            # Semi: customers with orders, left columns only
+            pytest.param("semi", [1, 2, 3, 4], None, id="semi"),
+            # Anti: customers without orders, left columns only
+            pytest.param("anti", [5], None, id="anti"),
+        ],
+    )
+    def test_join_type(
+        self,
+        sample_customers_df,
+        context_with_datasets,
+        how,
+        expected_ids,
+        unmatched_ids,
+    ):
+        """Test which rows and columns each join type keeps."""
         transformer = JoinTransformer(
-            name="left_join",
+            name=f"{how}_join",
             config={
                 "right_dataset": "orders",
                 "on": "customer_id",
-                "how": "left",
+                "how": how,
             }
         )
         
         result = transformer.transform(sample_customers_df, context_with_datasets)
         
-        # Customer 5 (Eve) has no orders, so order_id should be null
-        eve_rows = result.filter(pl.col("name") == "Eve")
-        if len(eve_rows) > 0:
-            assert eve_rows["order_id"].is_null().all()
+        assert result["customer_id"].unique().sort().equals(pl.Series(expected_ids))
+        if unmatched_ids is None:
+            assert "order_id" not in result.columns
+            assert "amount" not in result.columns
+        else:
+            mask = result["order_id"].is_null()
+            assert result["customer_id"].filter(mask).equals(pl.Series(unmatched_ids))
     
     def test_outer_join(self, sample_customers_df, sample_orders_df):
         """Test outer join includes all rows from both tables."""
@@ -195,54 +223,10 @@ class TestJoinTransformerJoinTypes:
         # but customer_id_right contains the value. Customer 4 is only in orders.
         # Check that we have a row with customer_id_right = 4
         assert "customer_id_right" in result.columns
-        right_customer_ids = result["customer_id_right"].unique().to_list()
-        assert 4 in right_customer_ids  # Customer 4 from orders only
-    
-    def test_semi_join(self, sample_customers_df, context_with_datasets):
-        """Test semi join returns only left columns for matching rows."""
-        transformer = JoinTransformer(
-            name="semi_join",
-            config={
-                "right_dataset": "orders",
-                "on": "customer_id",
-                "how": "semi",
-            }
-        )
-        
-        result = transformer.transform(sample_customers_df, context_with_datasets)
-        
-        # Should only have left columns
-        assert "order_id" not in result.columns
-        assert "amount" not in result.columns
-        # Should only include customers with orders
-        customer_ids = result["customer_id"].to_list()
-        assert 5 not in customer_ids  # Eve has no orders
-    
-    def test_anti_join(self, sample_customers_df, context_with_datasets):
-        """Test anti join returns rows that don't match."""
-        transformer = JoinTransformer(
-            name="anti_join",
-            config={
-                "right_dataset": "orders",
-                "on": "customer_id",
-                "how": "anti",
-            }
-        )
-        
-        result = transformer.transform(sample_customers_df, context_with_datasets)
-        
-        # Should only include customers WITHOUT orders
-        customer_ids = result["customer_id"].to_list()
-        assert 5 in customer_ids  # Eve has no orders
-        assert 1 not in customer_ids  # Alice has orders
+        assert result["customer_id_right"].eq(4).any()  # Customer 4 from orders only
     
-    def test_cross_join(self, sample_customers_df, sample_products_df):
+    def test_cross_join(self, sample_customers_df, context_with_datasets):
         """Test cross join produces cartesian product."""
-        context = TransformationContext(
-            data=sample_customers_df,
-            datasets={"products": sample_products_df},
-        )
-        
         transformer = JoinTransformer(
             name="cross_join",
             config={
@@ -251,7 +235,7 @@ class TestJoinTransformerJoinTypes:
             }
         )
         
-        result = transformer.transform(sample_customers_df, context)
+        result = transformer.transform(sample_customers_df, context_with_datasets)
         
         # Cross join: 5 customers * 4 products = 20 rows
         assert len(result) == 5 * 4
@@ -260,124 +244,89 @@ class TestJoinTransformerJoinTypes:
 class TestJoinTransformerValidation:
     """Tests for configuration validation."""
     
-    def test_validate_missing_right_dataset(self):
-        """Test validation catches missing right_dataset."""
-        transformer = JoinTransformer(name="test", config={})
-        
-        error = transformer.validate_config({})
-        
-        assert error is not None
-        assert "right_dataset" in error.lower()
-    
-    def test_validate_valid_config(self):
-        """Test validation passes with valid config."""
-        transformer = JoinTransformer(
-            name="test",
-            config={
-                "right_dataset": "orders",
-                "on": "customer_id",
-            }
-        )
-        
-        error = transformer.validate_config({
-            "right_dataset": "orders",
-            "on": "customer_id",
-        })
-        
-        assert error is None
+    @pytest.mark.parametrize(
+        "config,expected_error",
+        [
+            pytest.param({}, "right_dataset", id="missing_right_dataset"),
+            pytest.param(
+                {"right_dataset": "orders", "on": "customer_id"},
+                None,
+                id="valid_config",
+            ),
+        ],
+    )
+    def test_validate_config(self, check_validate_config, config, expected_error):
+        """Test validation of the dataset name."""
+        check_validate_config(JoinTransformer, config, expected_error)
     
-    def test_invalid_join_type_raises_error(
+    @pytest.mark.parametrize(
+        "config,expected_exception,expected_message",
+        [
+            pytest.param(
+                {"right_dataset": "orders", "on": "customer_id", "how": "invalid_type"},
+                ConfigurationError,
+                "invalid_type",
+                id="invalid_join_type",
+            ),
+            pytest.param(
+                {"right_dataset": "nonexistent", "on": "customer_id"},
+                TransformationError,
+                "nonexistent",
+                id="missing_dataset",
+            ),
+            pytest.param(
+                # Missing: on, left_on, right_on (required for non-cross joins)
+                {"right_dataset": "orders", "how": "inner"},
+                ConfigurationError,
+                "'on'",
+                id="missing_join_keys",
+            ),
+            pytest.param(
+                # The join type is checked before the dataset lookup
+                {"right_dataset": "nonexistent", "on": "customer_id", "how": "invalid_type"},
+                ConfigurationError,
+                "invalid_type",
+                id="invalid_join_type_and_missing_dataset",
+            ),
+            pytest.param(
+                # The dataset lookup fails before the join keys are checked
+                {"right_dataset": "nonexistent", "how": "inner"},
+                TransformationError,
+                "nonexistent",
+                id="missing_dataset_and_join_keys",
+            ),
+        ],
+    )
+    def test_transform_raises(
         self,
         sample_customers_df,
         context_with_datasets,
+        config,
+        expected_exception,
+        expected_message,
     ):
-        """Test that invalid join type raises error."""
-        transformer = JoinTransformer(
-            name="invalid_join",
-            config={
-                "right_dataset": "orders",
-                "on": "customer_id",
-                "how": "invalid_type",
-            }
-        )
+        """Test that bad join configs fail when transforming."""
+        transformer = JoinTransformer(name="t", config=config)
         
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(expected_exception) as exc_info:
             transformer.transform(sample_customers_df, context_with_datasets)
         
-        assert "invalid_type" in str(exc_info.value).lower()
-    
-    def test_missing_dataset_raises_error(self, sample_customers_df):
-        """Test that missing dataset raises error."""
-        context = TransformationContext(
-            data=sample_customers_df,
-            datasets={},  # No datasets
-        )
-        
-        transformer = JoinTransformer(
-            name="join_missing",
-            config={
-                "right_dataset": "nonexistent",
-                "on": "customer_id",
-            }
-        )
-        
-        with pytest.raises(TransformationError) as exc_info:
-            transformer.transform(sample_customers_df, context)
-        
-        assert "nonexistent" in str(exc_info.value).lower()
-    
-    def test_missing_join_keys_raises_error(
-        self,
-        sample_customers_df,
-        context_with_datasets,
-    ):
-        """Test that missing join keys raises error (for non-cross joins)."""
-        transformer = JoinTransformer(
-            name="no_keys",
-            config={
-                "right_dataset": "orders",
-                "how": "inner",
-                # Missing: on, left_on, right_on
-            }
-        )
-        
-        with pytest.raises(ConfigurationError) as exc_info:
-            transformer.transform(sample_customers_df, context_with_datasets)
-        
-        assert "on" in str(exc_info.value).lower() or "left_on" in str(exc_info.value).lower()
+        assert expected_message in str(exc_info.value)
 
 
 class TestJoinTransformerProperties:
     """Tests for transformer properties."""
     
-    def test_transformer_type(self):
-        """Test transformer_type property."""
+    def test_properties(self):
+        """Test transformer_type, input_type and get_required_datasets."""
         transformer = JoinTransformer(
             name="test",
             config={"right_dataset": "orders", "on": "id"}
         )
         
         assert transformer.transformer_type == "join"
-    
-    def test_input_type_is_multi(self):
-        """Test input_type is multi for joins."""
-        transformer = JoinTransformer(
-            name="test",
-            config={"right_dataset": "orders", "on": "id"}
-        )
-        
         assert transformer.input_type == "multi"
-    
-    def test_get_required_datasets(self):
-        """Test get_required_datasets returns right_dataset."""
-        transformer = JoinTransformer(
-            name="test",
-            config={"right_dataset": "orders", "on": "id"}
-        )
-        
-        required = transformer.get_required_datasets()
-        
-        assert "orders" in required
+        assert "orders" in transformer.get_required_datasets()
 
 
 class TestJoinTransformerEdgeCases:
@@ -412,10 +361,7 @@ class TestJoinTransformerEdgeCases:
     
     def test_join_empty_left_dataframe(self, sample_orders_df):
         """Test joining with empty left DataFrame."""
-        empty_df = pl.DataFrame({
-            "customer_id": [],
-            "name": [],
-        }).cast({"customer_id": pl.Int64, "name": pl.Utf8})
+        empty_df = pl.DataFrame(schema={"customer_id": pl.Int64, "name": pl.Utf8})
         
         context = TransformationContext(
             data=empty_df,
@@ -437,11 +383,9 @@ class TestJoinTransformerEdgeCases:
     
     def test_join_empty_right_dataframe(self, sample_customers_df):
         """Test joining with empty right DataFrame."""
-        empty_orders = pl.DataFrame({
-            "customer_id": [],
-            "order_id": [],
-            "amount": [],
-        }).cast({"customer_id": pl.Int64, "order_id": pl.Int64, "amount": pl.Float64})
+        empty_orders = pl.DataFrame(
+            schema={"customer_id": pl.Int64, "order_id": pl.Int64, "amount": pl.Float64}
+        )
         
         context = TransformationContext(
             data=sample_customers_df,
@@ -479,4 +423,4 @@ class TestJoinTransformerEdgeCases:
         result = transformer.transform(sample_customers_df, context_with_datasets)
         
         # Inner join behavior: no null order_ids
-        assert not result["order_id"].is_null().any()
+        assert result["order_id"].null_count() == 0
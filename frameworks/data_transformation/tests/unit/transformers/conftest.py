@@ -0,0 +1,52 @@
+"""Fixtures shared by the transformer tests."""
+
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+import pytest
+import polars as pl
+
+from frameworks.data_transformation.transformers.base_transformer import BaseTransformer
+
+
+@pytest.fixture(scope="session")
+def empty_frame() -> Callable[..., pl.DataFrame]:
+    """
+    Factory for zero-row DataFrames.
+    
+    Call it with (name, dtype) pairs, e.g.
+    empty_frame(("id", pl.Int64), ("value", pl.Float64)); each schema is
+    built once and the same frame is returned on later calls.
+    """
+    @functools.lru_cache(maxsize=None)
+    def build(*schema_items: Tuple[str, pl.DataType]) -> pl.DataFrame:
+        return pl.DataFrame(schema=dict(schema_items))
+    
+    return build
+
+
+@pytest.fixture(scope="session")
+def check_validate_config() -> Callable[
+    [Type[BaseTransformer], Dict[str, Any], Optional[str]], None
+]:
+    """
+    Assert what a transformer's validate_config returns for one config.
+    
+    Call it with (transformer_cls, config, expected_error). An expected_error
+    of None means the config must be accepted; otherwise the returned message
+    must contain it, compared case-insensitively.
+    """
+    def check(
+        transformer_cls: Type[BaseTransformer],
+        config: Dict[str, Any],
+        expected_error: Optional[str],
+    ) -> None:
+        error = transformer_cls(name="test", config={}).validate_config(config)
+        
+        if expected_error is None:
+            assert error is None
+        else:
+            assert error is not None
+            assert expected_error.lower() in error.lower()
+    
+    return check
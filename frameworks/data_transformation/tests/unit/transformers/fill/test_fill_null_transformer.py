@@ -7,19 +7,30 @@ from frameworks.data_transformation.transformers.fill.fill_null import FillNullT
 from frameworks.data_transformation.exceptions import ConfigurationError
 
 
+@pytest.fixture(scope="module")
+def fill_null_zero() -> FillNullTransformer:
+    """Transformer replacing nulls with 0 in every column."""
+    return FillNullTransformer(name="fill_null_zero", config={"value": 0})
+
+
+@pytest.fixture(scope="module")
+def null_value_df() -> pl.DataFrame:
+    """Float column with nulls at positions 1 and 3."""
+    return pl.DataFrame({"value": [10.0, None, 30.0, None, 50.0]})
+
+
 class TestFillNullTransformer:
     """Tests for FillNullTransformer."""
 
-    def test_fill_null_with_value(self, df_with_nulls, empty_context):
+    def test_fill_null_with_value(self, df_with_nulls, empty_context, fill_null_zero):
         """Test filling nulls with a literal value."""
-        transformer = FillNullTransformer(
-            name="fill_value",
-            config={"value": 0}
-        )
-        result = transformer.transform(df_with_nulls, empty_context)
+        result = fill_null_zero.transform(df_with_nulls, empty_context)
         
         # All nulls should be replaced
         assert result["value"].null_count() == 0
+        # The shared input frame must not be modified in place
+        assert result is not df_with_nulls
+        assert df_with_nulls["value"].null_count() == 1
 
     def test_fill_null_with_string_value(self, empty_context):
         """Test filling string nulls with a string value."""
@@ -35,7 +46,7 @@ class TestFillNullTransformer:
         result = transformer.transform(df, empty_context)
         
         assert result["name"].null_count() == 0
-        assert result["name"][1] == "Unknown"
+        assert result["name"].item(1) == "Unknown"
 
     def test_fill_null_specific_columns(self, df_with_nulls, empty_context):
         """Test filling nulls in specific columns only."""
@@ -50,117 +61,32 @@ class TestFillNullTransformer:
         # value column should still have nulls
         assert result["value"].null_count() == 1
 
-    def test_fill_null_forward_strategy(self, empty_context):
-        """Test filling nulls with forward strategy."""
-        df = pl.DataFrame({
-            "id": [1, 2, 3, 4],
-            "value": [10.0, None, None, 40.0]
-        })
-        
-        transformer = FillNullTransformer(
-            name="fill_forward",
-            config={"strategy": "forward"}
-        )
-        result = transformer.transform(df, empty_context)
-        
-        # Forward fill: 10, 10, 10, 40
-        assert result["value"].to_list() == [10.0, 10.0, 10.0, 40.0]
-
-    def test_fill_null_backward_strategy(self, empty_context):
-        """Test filling nulls with backward strategy."""
-        df = pl.DataFrame({
-            "id": [1, 2, 3, 4],
-            "value": [10.0, None, None, 40.0]
-        })
-        
-        transformer = FillNullTransformer(
-            name="fill_backward",
-            config={"strategy": "backward"}
-        )
-        result = transformer.transform(df, empty_context)
-        
-        # Backward fill: 10, 40, 40, 40
-        assert result["value"].to_list() == [10.0, 40.0, 40.0, 40.0]
-
-    def test_fill_null_min_strategy(self, empty_context):
-        """Test filling nulls with min strategy."""
-        df = pl.DataFrame({
-            "value": [10.0, None, 30.0, None, 50.0]
-        })
-        
-        transformer = FillNullTransformer(
-            name="fill_min",
-            config={"strategy": "min"}
-        )
-        result = transformer.transform(df, empty_context)
-        
-        # Min value is 10
-        assert result["value"].null_count() == 0
-        assert result["value"][1] == 10.0
-        assert result["value"][3] == 10.0
-
-    def test_fill_null_max_strategy(self, empty_context):
-        """Test filling nulls with max strategy."""
-        df = pl.DataFrame({
-            "value": [10.0, None, 30.0, None, 50.0]
-        })
-        
-        transformer = FillNullTransformer(
-            name="fill_max",
-            config={"strategy": "max"}
-        )
-        result = transformer.transform(df, empty_context)
-        
-        # Max value is 50
-        assert result["value"].null_count() == 0
-        assert result["value"][1] == 50.0
-        assert result["value"][3] == 50.0
-
-    def test_fill_null_mean_strategy(self, empty_context):
-        """Test filling nulls with mean strategy."""
-        df = pl.DataFrame({
-            "value": [10.0, None, 30.0, None, 50.0]
-        })
-        
-        transformer = FillNullTransformer(
-            name="fill_mean",
-            config={"strategy": "mean"}
-        )
-        result = transformer.transform(df, empty_context)
-        
-        # Mean is (10 + 30 + 50) / 3 = 30
-        assert result["value"].null_count() == 0
-        assert result["value"][1] == 30.0
-
-    def test_fill_null_zero_strategy(self, empty_context):
-        """Test filling nulls with zero strategy."""
-        df = pl.DataFrame({
-            "value": [10.0, None, 30.0]
-        })
-        
-        transformer = FillNullTransformer(
-            name="fill_zero",
-            config={"strategy": "zero"}
-        )
-        result = transformer.transform(df, empty_context)
-        
-        assert result["value"].null_count() == 0
-        assert result["value"][1] == 0.0
-
-    def test_fill_null_one_strategy(self, empty_context):
-        """Test filling nulls with one strategy."""
-        df = pl.DataFrame({
-            "value": [10.0, None, 30.0]
-        })
-        
-        transformer = FillNullTransformer(
-            name="fill_one",
-            config={"strategy": "one"}
-        )
-        result = transformer.transform(df, empty_context)
+    @pytest.mark.parametrize(
+        "strategy,idx1,idx3",
+        [
+            # Forward fill takes the previous value: 10, 10, 30, 30, 50
+            ("forward", 10.0, 30.0),
+            # Backward fill takes the next value: 10, 30, 30, 50, 50
+            ("backward", 30.0, 50.0),
+            ("min", 10.0, 10.0),
+            ("max", 50.0, 50.0),
+            # Mean is (10 + 30 + 50) / 3 = 30
+            ("mean", 30.0, 30.0),
+            ("zero", 0.0, 0.0),
+            ("one", 1.0, 1.0),
+        ],
+    )
+    def test_fill_null_strategy(self, null_value_df, empty_context, strategy, idx1, idx3):
+        """Test filling nulls with each fill strategy."""
+        transformer = FillNullTransformer(
+            name=f"fill_{strategy}",
+            config={"strategy": strategy}
+        )
+        result = transformer.transform(null_value_df, empty_context)
         
         assert result["value"].null_count() == 0
-        assert result["value"][1] == 1.0
+        assert result["value"].item(1) == idx1
+        assert result["value"].item(3) == idx3
 
     def test_fill_null_strategy_with_columns(self, empty_context):
         """Test filling with strategy for specific columns."""
@@ -180,29 +106,18 @@ class TestFillNullTransformer:
         # 'b' should still have null
         assert result["b"].null_count() == 1
 
-    def test_fill_null_no_nulls(self, sample_customers_df, empty_context):
+    def test_fill_null_no_nulls(self, sample_customers_df, empty_context, fill_null_zero):
         """Test filling when DataFrame has no nulls."""
-        transformer = FillNullTransformer(
-            name="fill_no_nulls",
-            config={"value": 0}
-        )
-        result = transformer.transform(sample_customers_df, empty_context)
+        result = fill_null_zero.transform(sample_customers_df, empty_context)
         
         # Should be unchanged
         assert result.equals(sample_customers_df)
 
-    def test_fill_null_empty_dataframe(self, empty_context):
+    def test_fill_null_empty_dataframe(self, empty_context, empty_frame, fill_null_zero):
         """Test filling empty DataFrame."""
-        empty_df = pl.DataFrame({
-            "id": pl.Series([], dtype=pl.Int64),
-            "value": pl.Series([], dtype=pl.Float64)
-        })
+        empty_df = empty_frame(("id", pl.Int64), ("value", pl.Float64))
         
-        transformer = FillNullTransformer(
-            name="fill_empty",
-            config={"value": 0}
-        )
-        result = transformer.transform(empty_df, empty_context)
+        result = fill_null_zero.transform(empty_df, empty_context)
         
         assert len(result) == 0
 
@@ -210,9 +125,8 @@ class TestFillNullTransformer:
         """Test error when neither value nor strategy is provided."""
         transformer = FillNullTransformer(name="fill_invalid", config={})
         
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match="'value' or 'strategy'"):
             transformer.transform(df_with_nulls, empty_context)
-        assert "value" in str(exc_info.value).lower() or "strategy" in str(exc_info.value).lower()
 
     def test_fill_null_both_value_and_strategy(self, df_with_nulls, empty_context):
         """Test error when both value and strategy are provided."""
@@ -231,46 +145,22 @@ class TestFillNullTransformer:
             config={"strategy": "invalid"}
         )
         
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match="Invalid strategy 'invalid'"):
             transformer.transform(df_with_nulls, empty_context)
-        assert "invalid" in str(exc_info.value).lower()
 
-    def test_validate_config_missing_both(self):
-        """Test validation fails when both value and strategy are missing."""
-        transformer = FillNullTransformer(name="test", config={})
-        error = transformer.validate_config({})
-        
-        assert error is not None
-
-    def test_validate_config_both_present(self):
-        """Test validation fails when both value and strategy are present."""
-        config = {"value": 0, "strategy": "forward"}
-        transformer = FillNullTransformer(name="test", config=config)
-        error = transformer.validate_config(config)
-        
-        assert error is not None
-        assert "both" in error.lower()
-
-    def test_validate_config_valid_value(self):
-        """Test validation passes with valid value config."""
-        config = {"value": 0}
-        transformer = FillNullTransformer(name="test", config=config)
-        error = transformer.validate_config(config)
-        
-        assert error is None
-
-    def test_validate_config_valid_strategy(self):
-        """Test validation passes with valid strategy config."""
-        config = {"strategy": "forward"}
-        transformer = FillNullTransformer(name="test", config=config)
-        error = transformer.validate_config(config)
-        
-        assert error is None
-
-    def test_transformer_type(self):
+    @pytest.mark.parametrize(
+        "config,expected_error",
+        [
+            pytest.param({}, "either", id="missing_both"),
+            pytest.param({"value": 0, "strategy": "forward"}, "both", id="both_present"),
+            pytest.param({"value": 0}, None, id="valid_value"),
+            pytest.param({"strategy": "forward"}, None, id="valid_strategy"),
+        ],
+    )
+    def test_validate_config(self, check_validate_config, config, expected_error):
+        """Test validate_config on valid and invalid configs."""
+        check_validate_config(FillNullTransformer, config, expected_error)
+
+    def test_transformer_type(self, fill_null_zero):
         """Test transformer_type property returns correct value."""
-        transformer = FillNullTransformer(
-            name="test",
-            config={"value": 0}
-        )
-        assert transformer.transformer_type == "fill_null"
+        assert fill_null_zero.transformer_type == "fill_null"
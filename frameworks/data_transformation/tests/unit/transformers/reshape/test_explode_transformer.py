@@ -6,19 +6,66 @@ import pytest
 from frameworks.data_transformation.transformers.reshape.explode import ExplodeTransformer
 
 
+@pytest.fixture(scope="module")
+def explode_tags() -> ExplodeTransformer:
+    """Transformer exploding the 'tags' column."""
+    return ExplodeTransformer(name="explode_tags", config={"columns": "tags"})
+
+
+@pytest.fixture(scope="module")
+def empty_list_df() -> pl.DataFrame:
+    """List column where id=2 holds an empty list."""
+    return pl.DataFrame({
+        "id": [1, 2, 3],
+        "tags": [["a", "b"], [], ["c"]]
+    })
+
+
+@pytest.fixture(scope="module")
+def single_element_df() -> pl.DataFrame:
+    """List column where every list has one element."""
+    return pl.DataFrame({
+        "id": [1, 2, 3],
+        "tags": [["a"], ["b"], ["c"]]
+    })
+
+
+@pytest.fixture(scope="module")
+def null_list_df() -> pl.DataFrame:
+    """List column where id=2 holds a null instead of a list."""
+    return pl.DataFrame({
+        "id": [1, 2, 3],
+        "tags": [["a", "b"], None, ["c"]]
+    })
+
+
+@pytest.fixture(scope="module")
+def int_list_df() -> pl.DataFrame:
+    """Integer list column."""
+    return pl.DataFrame({
+        "id": [1, 2],
+        "numbers": [[10, 20, 30], [40, 50]]
+    })
+
+
+@pytest.fixture(scope="module")
+def ordered_items_df() -> pl.DataFrame:
+    """List column whose exploded values run a to e."""
+    return pl.DataFrame({
+        "id": [1, 2],
+        "items": [["a", "b", "c"], ["d", "e"]]
+    })
+
+
 class TestExplodeTransformer:
     """Tests for ExplodeTransformer."""
 
-    def test_explode_single_list_column(self, df_with_lists, empty_context):
+    def test_explode_single_list_column(self, df_with_lists, empty_context, explode_tags):
         """Test exploding a single list column."""
-        transformer = ExplodeTransformer(
-            name="explode_tags",
-            config={"columns": "tags"}
-        )
-        result = transformer.transform(df_with_lists, empty_context)
+        result = explode_tags.transform(df_with_lists, empty_context)
         
         # Original has 3 rows with lists of length 2, 2, 3 = 7 total rows
-        assert len(result) == 7
+        assert result.height == 7
         assert "tags" in result.columns
         # Tags should now be individual values, not lists
         assert result["tags"].dtype == pl.Utf8
@@ -31,152 +78,102 @@ class TestExplodeTransformer:
         )
         result = transformer.transform(df_with_lists, empty_context)
         
-        assert len(result) == 7
+        assert result.height == 7
 
-    def test_explode_preserves_other_columns(self, df_with_lists, empty_context):
+    def test_explode_lazy_frame(self, df_with_lists, empty_context, explode_tags):
+        """Test that a LazyFrame input stays lazy."""
+        result = explode_tags.transform(df_with_lists.lazy(), empty_context)
+        
+        assert isinstance(result, pl.LazyFrame)
+        alice_tags = result.filter(pl.col("name") == "Alice").select("tags").collect()
+        assert alice_tags["tags"].to_list() == ["python", "data"]
+
+    def test_explode_preserves_other_columns(self, df_with_lists, empty_context, explode_tags):
         """Test that explode preserves other columns."""
-        transformer = ExplodeTransformer(
-            name="explode_preserve",
-            config={"columns": "tags"}
-        )
-        result = transformer.transform(df_with_lists, empty_context)
+        result = explode_tags.transform(df_with_lists, empty_context)
         
         assert "id" in result.columns
         assert "name" in result.columns
         
         # Check Alice's rows
         alice_rows = result.filter(pl.col("name") == "Alice")
-        assert len(alice_rows) == 2  # Alice has 2 tags
-        assert set(alice_rows["tags"].to_list()) == {"python", "data"}
+        assert alice_rows.height == 2  # Alice has 2 tags
+        assert alice_rows["tags"].sort().to_list() == ["data", "python"]
 
-    def test_explode_empty_list(self, empty_context):
+    def test_explode_empty_list(self, empty_context, empty_list_df, explode_tags):
         """Test exploding with empty list values."""
-        df = pl.DataFrame({
-            "id": [1, 2, 3],
-            "tags": [["a", "b"], [], ["c"]]
-        })
-        
-        transformer = ExplodeTransformer(
-            name="explode_empty",
-            config={"columns": "tags"}
-        )
-        result = transformer.transform(df, empty_context)
+        result = explode_tags.transform(empty_list_df, empty_context)
         
         # In Polars, empty list explodes to a single row with null value
         # Total: 2 + 1 (null for empty list) + 1 = 4 rows
-        assert len(result) == 4
+        assert result.height == 4
         # id=2 should have a null tag value
         id2_row = result.filter(pl.col("id") == 2)
-        assert len(id2_row) == 1
-        assert id2_row["tags"][0] is None
+        assert id2_row.height == 1
+        assert id2_row.item(0, "tags") is None
 
-    def test_explode_single_element_lists(self, empty_context):
+    def test_explode_single_element_lists(self, empty_context, single_element_df, explode_tags):
         """Test exploding lists with single elements."""
-        df = pl.DataFrame({
-            "id": [1, 2, 3],
-            "tags": [["a"], ["b"], ["c"]]
-        })
-        
-        transformer = ExplodeTransformer(
-            name="explode_single",
-            config={"columns": "tags"}
-        )
-        result = transformer.transform(df, empty_context)
+        result = explode_tags.transform(single_element_df, empty_context)
         
-        assert len(result) == 3
+        assert result.height == 3
         assert result["tags"].to_list() == ["a", "b", "c"]
 
-    def test_explode_empty_dataframe(self, empty_context):
+    def test_explode_empty_dataframe(self, empty_context, explode_tags):
         """Test exploding empty DataFrame."""
         df = pl.DataFrame({
             "id": pl.Series([], dtype=pl.Int64),
             "tags": pl.Series([], dtype=pl.List(pl.Utf8))
         })
         
-        transformer = ExplodeTransformer(
-            name="explode_empty_df",
-            config={"columns": "tags"}
-        )
-        result = transformer.transform(df, empty_context)
+        result = explode_tags.transform(df, empty_context)
         
-        assert len(result) == 0
+        assert result.height == 0
 
-    def test_explode_with_null_lists(self, empty_context):
+    def test_explode_with_null_lists(self, empty_context, null_list_df, explode_tags):
         """Test exploding with null list values."""
-        df = pl.DataFrame({
-            "id": [1, 2, 3],
-            "tags": [["a", "b"], None, ["c"]]
-        })
-        
-        transformer = ExplodeTransformer(
-            name="explode_null",
-            config={"columns": "tags"}
-        )
-        result = transformer.transform(df, empty_context)
+        result = explode_tags.transform(null_list_df, empty_context)
         
         # null list becomes a null value
-        assert len(result) == 4  # 2 + 1 (null) + 1 = 4
+        assert result.height == 4  # 2 + 1 (null) + 1 = 4
         assert result["tags"].null_count() == 1
 
-    def test_explode_integer_list(self, empty_context):
+    def test_explode_integer_list(self, empty_context, int_list_df):
         """Test exploding list of integers."""
-        df = pl.DataFrame({
-            "id": [1, 2],
-            "numbers": [[10, 20, 30], [40, 50]]
-        })
-        
         transformer = ExplodeTransformer(
             name="explode_int",
             config={"columns": "numbers"}
         )
-        result = transformer.transform(df, empty_context)
+        result = transformer.transform(int_list_df, empty_context)
         
-        assert len(result) == 5
+        assert result.height == 5
         assert result["numbers"].dtype == pl.Int64
-        assert set(result["numbers"].to_list()) == {10, 20, 30, 40, 50}
+        assert result["numbers"].sort().equals(pl.Series("numbers", [10, 20, 30, 40, 50]))
 
-    def test_explode_maintains_row_order(self, empty_context):
+    def test_explode_maintains_row_order(self, empty_context, ordered_items_df):
         """Test that explode maintains row order."""
-        df = pl.DataFrame({
-            "id": [1, 2],
-            "items": [["a", "b", "c"], ["d", "e"]]
-        })
-        
         transformer = ExplodeTransformer(
             name="explode_order",
             config={"columns": "items"}
         )
-        result = transformer.transform(df, empty_context)
+        result = transformer.transform(ordered_items_df, empty_context)
         
         # Order should be: a, b, c, d, e
         assert result["items"].to_list() == ["a", "b", "c", "d", "e"]
         assert result["id"].to_list() == [1, 1, 1, 2, 2]
 
-    def test_validate_config_missing_columns(self):
-        """Test validation fails when columns is missing."""
-        transformer = ExplodeTransformer(name="test", config={})
-        error = transformer.validate_config({})
-        
-        assert error is not None
-        assert "columns" in error.lower()
-
-    def test_validate_config_valid(self):
-        """Test validation passes with valid config."""
-        config = {"columns": "tags"}
-        transformer = ExplodeTransformer(name="test", config=config)
-        error = transformer.validate_config(config)
-        
-        assert error is None
-
-    def test_validate_config_valid_list(self):
-        """Test validation passes with columns as list."""
-        config = {"columns": ["tags", "categories"]}
-        transformer = ExplodeTransformer(name="test", config=config)
-        error = transformer.validate_config(config)
-        
-        assert error is None
-
-    def test_transformer_type(self):
+    @pytest.mark.parametrize(
+        "config,expected_error",
+        [
+            pytest.param({}, "columns", id="missing_columns"),
+            pytest.param({"columns": "tags"}, None, id="valid"),
+            pytest.param({"columns": ["tags", "categories"]}, None, id="valid_list"),
+        ],
+    )
+    def test_validate_config(self, check_validate_config, config, expected_error):
+        """Test validate_config on valid and invalid configs."""
+        check_validate_config(ExplodeTransformer, config, expected_error)
+
+    def test_transformer_type(self, explode_tags):
         """Test transformer_type property returns correct value."""
-        transformer = ExplodeTransformer(name="test", config={"columns": "tags"})
-        assert transformer.transformer_type == "explode"
+        assert explode_tags.transformer_type == "explode"
@@ -2,15 +2,35 @@
 
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 from frameworks.data_transformation.transformers.reshape.pivot import PivotTransformer
 from frameworks.data_transformation.exceptions import ConfigurationError
 
 
+@pytest.fixture(scope="module")
+def pivot_sales() -> PivotTransformer:
+    """Transformer pivoting sales by month, one row per product."""
+    return PivotTransformer(
+        name="pivot_sales",
+        config={"on": "month", "index": "product", "values": "sales"},
+    )
+
+
+@pytest.fixture(scope="module")
+def sales_df() -> pl.DataFrame:
+    """Sales where product A has two Jan entries (100 and 200)."""
+    return pl.DataFrame({
+        "product": ["A", "A", "A", "B"],
+        "month": ["Jan", "Jan", "Feb", "Jan"],
+        "sales": [100, 200, 150, 300]
+    })
+
+
 class TestPivotTransformer:
     """Tests for PivotTransformer."""
 
-    def test_basic_pivot(self, empty_context):
+    def test_basic_pivot(self, empty_context, pivot_sales):
         """Test basic pivot operation."""
         df = pl.DataFrame({
             "product": ["A", "A", "B", "B"],
@@ -18,154 +38,45 @@ class TestPivotTransformer:
             "sales": [100, 150, 200, 250]
         })
         
-        transformer = PivotTransformer(
-            name="pivot_basic",
-            config={
-                "on": "month",
-                "index": "product",
-                "values": "sales"
-            }
-        )
-        result = transformer.transform(df, empty_context)
-        
-        assert "product" in result.columns
-        assert "Jan" in result.columns
-        assert "Feb" in result.columns
-        assert len(result) == 2
-
-    def test_pivot_with_sum_aggregate(self, empty_context):
-        """Test pivot with sum aggregation."""
-        df = pl.DataFrame({
-            "product": ["A", "A", "A", "B"],
-            "month": ["Jan", "Jan", "Feb", "Jan"],
-            "sales": [100, 50, 150, 200]
+        expected = pl.DataFrame({
+            "product": ["A", "B"],
+            "Jan": [100, 200],
+            "Feb": [150, 250]
         })
         
-        transformer = PivotTransformer(
-            name="pivot_sum",
-            config={
-                "on": "month",
-                "index": "product",
-                "values": "sales",
-                "aggregate_function": "sum"
-            }
-        )
-        result = transformer.transform(df, empty_context)
-        
-        # Product A in Jan should sum to 150 (100 + 50)
-        a_row = result.filter(pl.col("product") == "A")
-        assert a_row["Jan"][0] == 150
-
-    def test_pivot_with_mean_aggregate(self, empty_context):
-        """Test pivot with mean aggregation."""
-        df = pl.DataFrame({
-            "product": ["A", "A", "B"],
-            "month": ["Jan", "Jan", "Jan"],
-            "sales": [100.0, 200.0, 300.0]
-        })
-        
-        transformer = PivotTransformer(
-            name="pivot_mean",
-            config={
-                "on": "month",
-                "index": "product",
-                "values": "sales",
-                "aggregate_function": "mean"
-            }
-        )
-        result = transformer.transform(df, empty_context)
-        
-        # Product A mean should be 150
-        a_row = result.filter(pl.col("product") == "A")
-        assert a_row["Jan"][0] == 150.0
-
-    def test_pivot_with_count_aggregate(self, empty_context):
-        """Test pivot with count aggregation."""
-        df = pl.DataFrame({
-            "product": ["A", "A", "A", "B"],
-            "month": ["Jan", "Jan", "Feb", "Jan"],
-            "sales": [100, 50, 150, 200]
-        })
-        
-        transformer = PivotTransformer(
-            name="pivot_count",
-            config={
-                "on": "month",
-                "index": "product",
-                "values": "sales",
-                "aggregate_function": "count"
-            }
-        )
-        result = transformer.transform(df, empty_context)
-        
-        # Product A has 2 Jan entries
-        a_row = result.filter(pl.col("product") == "A")
-        assert a_row["Jan"][0] == 2
-
-    def test_pivot_with_min_aggregate(self, empty_context):
-        """Test pivot with min aggregation."""
-        df = pl.DataFrame({
-            "product": ["A", "A"],
-            "month": ["Jan", "Jan"],
-            "sales": [100, 200]
-        })
-        
-        transformer = PivotTransformer(
-            name="pivot_min",
-            config={
-                "on": "month",
-                "index": "product",
-                "values": "sales",
-                "aggregate_function": "min"
-            }
-        )
-        result = transformer.transform(df, empty_context)
-        
-        assert result["Jan"][0] == 100
-
-    def test_pivot_with_max_aggregate(self, empty_context):
-        """Test pivot with max aggregation."""
-        df = pl.DataFrame({
-            "product": ["A", "A"],
-            "month": ["Jan", "Jan"],
-            "sales": [100, 200]
-        })
+        result = pivot_sales.transform(df, empty_context)
         
-        transformer = PivotTransformer(
-            name="pivot_max",
-            config={
-                "on": "month",
-                "index": "product",
-                "values": "sales",
-                "aggregate_function": "max"
-            }
+        assert_frame_equal(
+            result.sort("product"),
+            expected.sort("product"),
+            check_column_order=False,
+            check_dtypes=False,
         )
-        result = transformer.transform(df, empty_context)
-        
-        assert result["Jan"][0] == 200
 
-    def test_pivot_default_first_aggregate(self, empty_context):
-        """Test pivot uses first as default aggregate."""
-        df = pl.DataFrame({
-            "product": ["A", "A"],
-            "month": ["Jan", "Jan"],
-            "sales": [100, 200]
-        })
+    @pytest.mark.parametrize(
+        "agg_fn,expected",
+        [
+            pytest.param("sum", 300, id="sum"),
+            pytest.param("mean", 150.0, id="mean"),
+            pytest.param("count", 2, id="count"),
+            pytest.param("min", 100, id="min"),
+            pytest.param("max", 200, id="max"),
+            # No aggregate_function: the first value is taken
+            pytest.param(None, 100, id="default_first"),
+        ],
+    )
+    def test_pivot_aggregate(self, sales_df, empty_context, agg_fn, expected):
+        """Test how each aggregate function combines product A's Jan sales."""
+        config = {"on": "month", "index": "product", "values": "sales"}
+        if agg_fn is not None:
+            config["aggregate_function"] = agg_fn
         
-        transformer = PivotTransformer(
-            name="pivot_default",
-            config={
-                "on": "month",
-                "index": "product",
-                "values": "sales"
-            }
-        )
-        result = transformer.transform(df, empty_context)
+        transformer = PivotTransformer(name=f"pivot_{agg_fn}", config=config)
+        result = transformer.transform(sales_df, empty_context)
         
-        # First value should be taken (100)
-        assert result["Jan"][0] == 100
+        assert result.filter(pl.col("product") == "A").item(0, "Jan") == expected
 
-    def test_pivot_multiple_on_values(self, empty_context):
+    def test_pivot_multiple_on_values(self, empty_context, pivot_sales):
         """Test pivot creates columns for each unique 'on' value."""
         df = pl.DataFrame({
             "product": ["A", "A", "A"],
@@ -173,15 +84,7 @@ class TestPivotTransformer:
             "sales": [100, 150, 200]
         })
         
-        transformer = PivotTransformer(
-            name="pivot_multi_on",
-            config={
-                "on": "month",
-                "index": "product",
-                "values": "sales"
-            }
-        )
-        result = transformer.transform(df, empty_context)
+        result = pivot_sales.transform(df, empty_context)
         
         assert set(result.columns) == {"product", "Jan", "Feb", "Mar"}
 
@@ -207,56 +110,24 @@ class TestPivotTransformer:
             transformer.transform(df, empty_context)
         assert "invalid" in str(exc_info.value).lower()
 
-    def test_validate_config_missing_on(self):
-        """Test validation fails when 'on' is missing."""
-        transformer = PivotTransformer(
-            name="test",
-            config={"index": "product", "values": "sales"}
-        )
-        error = transformer.validate_config({"index": "product", "values": "sales"})
-        
-        assert error is not None
-        assert "on" in error.lower()
-
-    def test_validate_config_missing_index(self):
-        """Test validation fails when 'index' is missing."""
-        transformer = PivotTransformer(
-            name="test",
-            config={"on": "month", "values": "sales"}
-        )
-        error = transformer.validate_config({"on": "month", "values": "sales"})
-        
-        assert error is not None
-        assert "index" in error.lower()
-
-    def test_validate_config_missing_values(self):
-        """Test validation fails when 'values' is missing."""
-        transformer = PivotTransformer(
-            name="test",
-            config={"on": "month", "index": "product"}
-        )
-        error = transformer.validate_config({"on": "month", "index": "product"})
-        
-        assert error is not None
-        assert "values" in error.lower()
-
-    def test_validate_config_valid(self):
-        """Test validation passes with valid config."""
-        config = {"on": "month", "index": "product", "values": "sales"}
-        transformer = PivotTransformer(name="test", config=config)
-        error = transformer.validate_config(config)
-        
-        assert error is None
-
-    def test_transformer_type(self):
+    @pytest.mark.parametrize(
+        "config,expected_error",
+        [
+            pytest.param({"index": "product", "values": "sales"}, "on", id="missing_on"),
+            pytest.param({"on": "month", "values": "sales"}, "index", id="missing_index"),
+            pytest.param({"on": "month", "index": "product"}, "values", id="missing_values"),
+            pytest.param({"on": "month", "index": "product", "values": "sales"}, None, id="valid"),
+        ],
+    )
+    def test_validate_config(self, check_validate_config, config, expected_error):
+        """Test validate_config on valid and invalid configs."""
+        check_validate_config(PivotTransformer, config, expected_error)
+
+    def test_transformer_type(self, pivot_sales):
         """Test transformer_type property returns correct value."""
-        transformer = PivotTransformer(
-            name="test",
-            config={"on": "month", "index": "product", "values": "sales"}
-        )
-        assert transformer.transformer_type == "pivot"
+        assert pivot_sales.transformer_type == "pivot"
 
-    def test_pivot_with_nulls(self, empty_context):
+    def test_pivot_with_nulls(self, empty_context, pivot_sales):
         """Test pivot handles null values correctly."""
         df = pl.DataFrame({
             "product": ["A", "A", "B"],
@@ -264,16 +135,7 @@ class TestPivotTransformer:
             "sales": [100, None, 200]
         })
         
-        transformer = PivotTransformer(
-            name="pivot_nulls",
-            config={
-                "on": "month",
-                "index": "product",
-                "values": "sales"
-            }
-        )
-        result = transformer.transform(df, empty_context)
+        result = pivot_sales.transform(df, empty_context)
         
         # A's Feb should be null
-        a_row = result.filter(pl.col("product") == "A")
-        assert a_row["Feb"][0] is None
+        assert result.filter(pl.col("product") == "A").item(0, "Feb") is None
@@ -2,10 +2,20 @@
 
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 from frameworks.data_transformation.transformers.reshape.unpivot import UnpivotTransformer
 
 
+@pytest.fixture(scope="module")
+def unpivot_months() -> UnpivotTransformer:
+    """Transformer unpivoting the jan and feb columns, keyed by id."""
+    return UnpivotTransformer(
+        name="unpivot_months",
+        config={"on": ["jan", "feb"], "index": ["id"]},
+    )
+
+
 class TestUnpivotTransformer:
     """Tests for UnpivotTransformer."""
 
@@ -24,13 +34,21 @@ class TestUnpivotTransformer:
                 "index": ["product"]
             }
         )
+        expected = pl.DataFrame({
+            "product": ["A", "B", "A", "B"],
+            "variable": ["jan_sales", "jan_sales", "feb_sales", "feb_sales"],
+            "value": [100, 200, 150, 250]
+        })
+        
         result = transformer.transform(df, empty_context)
         
-        # Should have 4 rows (2 products x 2 months)
-        assert len(result) == 4
-        assert "product" in result.columns
-        assert "variable" in result.columns
-        assert "value" in result.columns
+        # 2 products x 2 months, compared independent of row order
+        assert_frame_equal(
+            result.sort("product", "variable"),
+            expected.sort("product", "variable"),
+            check_column_order=False,
+            check_dtypes=False,
+        )
 
     def test_unpivot_with_custom_names(self, empty_context):
         """Test unpivot with custom variable and value names."""
@@ -68,8 +86,8 @@ class TestUnpivotTransformer:
         )
         result = transformer.transform(df, empty_context)
         
-        assert len(result) == 3
-        assert set(result["variable"].to_list()) == {"jan", "feb", "mar"}
+        assert result.height == 3
+        assert result["variable"].sort().to_list() == ["feb", "jan", "mar"]
 
     def test_unpivot_preserves_values(self, empty_context):
         """Test that unpivot preserves correct values."""
@@ -89,10 +107,31 @@ class TestUnpivotTransformer:
         result = transformer.transform(df, empty_context)
         
         # Check specific values
-        id1_q1 = result.filter(
-            (pl.col("id") == 1) & (pl.col("variable") == "q1")
-        )["value"]
-        assert id1_q1[0] == 100
+        id1_q1 = result.filter((pl.col("id") == 1) & (pl.col("variable") == "q1"))
+        assert id1_q1.item(0, "value") == 100
+
+    def test_unpivot_lazy_frame(self, empty_context):
+        """Test that a LazyFrame input stays lazy."""
+        df = pl.DataFrame({
+            "id": [1, 2],
+            "q1": [100, 200],
+            "q2": [150, 250]
+        })
+        
+        transformer = UnpivotTransformer(
+            name="unpivot_lazy",
+            config={"on": ["q1", "q2"], "index": ["id"]}
+        )
+        result = transformer.transform(df.lazy(), empty_context)
+        
+        assert isinstance(result, pl.LazyFrame)
+        value = (
+            result.filter((pl.col("id") == 2) & (pl.col("variable") == "q2"))
+            .select("value")
+            .collect()
+            .item()
+        )
+        assert value == 250
 
     def test_unpivot_multiple_index_columns(self, empty_context):
         """Test unpivot with multiple index columns."""
@@ -112,7 +151,7 @@ class TestUnpivotTransformer:
         )
         result = transformer.transform(df, empty_context)
         
-        assert len(result) == 4
+        assert result.height == 4
         assert "product" in result.columns
         assert "region" in result.columns
 
@@ -132,10 +171,10 @@ class TestUnpivotTransformer:
         )
         result = transformer.transform(df, empty_context)
         
-        assert len(result) == 3
+        assert result.height == 3
         assert all(v == "value" for v in result["variable"].to_list())
 
-    def test_unpivot_empty_dataframe(self, empty_context):
+    def test_unpivot_empty_dataframe(self, empty_context, unpivot_months):
         """Test unpivot on empty DataFrame."""
         df = pl.DataFrame({
             "id": pl.Series([], dtype=pl.Int64),
@@ -143,18 +182,11 @@ class TestUnpivotTransformer:
             "feb": pl.Series([], dtype=pl.Float64)
         })
         
-        transformer = UnpivotTransformer(
-            name="unpivot_empty",
-            config={
-                "on": ["jan", "feb"],
-                "index": ["id"]
-            }
-        )
-        result = transformer.transform(df, empty_context)
+        result = unpivot_months.transform(df, empty_context)
         
-        assert len(result) == 0
+        assert result.height == 0
 
-    def test_unpivot_with_nulls(self, empty_context):
+    def test_unpivot_with_nulls(self, empty_context, unpivot_months):
         """Test unpivot handles null values correctly."""
         df = pl.DataFrame({
             "id": [1, 2],
@@ -162,57 +194,28 @@ class TestUnpivotTransformer:
             "feb": [None, 200]
         })
         
-        transformer = UnpivotTransformer(
-            name="unpivot_nulls",
-            config={
-                "on": ["jan", "feb"],
-                "index": ["id"]
-            }
-        )
-        result = transformer.transform(df, empty_context)
+        result = unpivot_months.transform(df, empty_context)
         
         # Nulls should be preserved
-        assert len(result) == 4
+        assert result.height == 4
         null_count = result["value"].null_count()
         assert null_count == 2
 
-    def test_validate_config_missing_on(self):
-        """Test validation fails when 'on' is missing."""
-        transformer = UnpivotTransformer(
-            name="test",
-            config={"index": ["id"]}
-        )
-        error = transformer.validate_config({"index": ["id"]})
-        
-        assert error is not None
-        assert "on" in error.lower()
-
-    def test_validate_config_on_not_list(self):
-        """Test validation fails when 'on' is not a list."""
-        transformer = UnpivotTransformer(
-            name="test",
-            config={"on": "jan"}
-        )
-        error = transformer.validate_config({"on": "jan"})
-        
-        assert error is not None
-        assert "list" in error.lower()
-
-    def test_validate_config_valid(self):
-        """Test validation passes with valid config."""
-        config = {"on": ["jan", "feb"]}
-        transformer = UnpivotTransformer(name="test", config=config)
-        error = transformer.validate_config(config)
-        
-        assert error is None
-
-    def test_transformer_type(self):
+    @pytest.mark.parametrize(
+        "config,expected_error",
+        [
+            pytest.param({"index": ["id"]}, "on", id="missing_on"),
+            pytest.param({"on": "jan"}, "list", id="on_not_list"),
+            pytest.param({"on": ["jan", "feb"]}, None, id="valid"),
+        ],
+    )
+    def test_validate_config(self, check_validate_config, config, expected_error):
+        """Test validate_config on valid and invalid configs."""
+        check_validate_config(UnpivotTransformer, config, expected_error)
+
+    def test_transformer_type(self, unpivot_months):
         """Test transformer_type property returns correct value."""
-        transformer = UnpivotTransformer(
-            name="test",
-            config={"on": ["jan", "feb"]}
-        )
-        assert transformer.transformer_type == "unpivot"
+        assert unpivot_months.transformer_type == "unpivot"
 
     def test_default_variable_and_value_names(self, empty_context):
         """Test default variable_name and value_name."""
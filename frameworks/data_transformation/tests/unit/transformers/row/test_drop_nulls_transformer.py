@@ -1,7 +1,6 @@
 """Tests for DropNullsTransformer."""
 
 import polars as pl
-import pytest
 
 from frameworks.data_transformation.transformers.row.drop_nulls import DropNullsTransformer
 
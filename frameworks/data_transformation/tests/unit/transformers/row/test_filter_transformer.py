@@ -1,6 +1,5 @@
 """Tests for FilterTransformer."""
 
-import pytest
 import polars as pl
 
 from frameworks.data_transformation.transformers.row.filter import FilterTransformer
@@ -1,7 +1,6 @@
 """Tests for HeadTransformer."""
 
 import polars as pl
-import pytest
 
 from frameworks.data_transformation.transformers.row.head import HeadTransformer
 
@@ -1,7 +1,6 @@
 """Tests for SliceTransformer."""
 
 import polars as pl
-import pytest
 
 from frameworks.data_transformation.transformers.row.slice import SliceTransformer
 
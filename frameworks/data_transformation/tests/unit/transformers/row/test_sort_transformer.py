@@ -1,7 +1,6 @@
 """Tests for SortTransformer."""
 
 import polars as pl
-import pytest
 
 from frameworks.data_transformation.transformers.row.sort import SortTransformer
 
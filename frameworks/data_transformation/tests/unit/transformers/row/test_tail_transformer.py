@@ -1,7 +1,6 @@
 """Tests for TailTransformer."""
 
 import polars as pl
-import pytest
 
 from frameworks.data_transformation.transformers.row.tail import TailTransformer
 
@@ -1,7 +1,6 @@
 """Tests for UniqueTransformer."""
 
 import polars as pl
-import pytest
 
 from frameworks.data_transformation.transformers.row.unique import UniqueTransformer
 
@@ -1,6 +1,6 @@
 """GroupByTransformer - Group by columns and aggregate."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import polars as pl
 
@@ -54,7 +54,8 @@ class GroupByTransformer(BaseTransformer):
     
     def __init__(self, name: str, config: Dict[str, Any]) -> None:
         super().__init__(name, config)
-        self._parser = ExpressionParser()
+        self._by_list: Optional[List[str]] = None
+        self._agg_exprs: Optional[List[pl.Expr]] = None
     
     @property
     def transformer_type(self) -> str:
@@ -66,36 +67,71 @@ class GroupByTransformer(BaseTransformer):
         context: TransformationContext,
     ) -> pl.DataFrame:
         """Group by columns and aggregate."""
-        by = self._get_required("by")
-        aggregations = self._get_required("aggregations", dict)
         maintain_order = self._get_optional("maintain_order", True, bool)
+        by, agg_exprs = self._compile()
         
-        # Normalize by to list
-        if isinstance(by, str):
-            by = [by]
+        return data.group_by(by, maintain_order=maintain_order).agg(agg_exprs)
+    
+    def _compile(self) -> Tuple[List[str], List[pl.Expr]]:
+        """
+        Build the group keys and aggregation expressions from the config.
         
-        # Build aggregation expressions
-        agg_exprs = []
-        for output_name, agg_spec in aggregations.items():
-            expr = self._parse_aggregation(agg_spec, output_name)
-            agg_exprs.append(expr)
+        The result is computed on first use and reused by every later
+        transform() call on this instance.
+        """
+        if self._agg_exprs is None:
+            by = self._get_required("by")
+            self._get_required("aggregations", dict)
+            
+            # Normalize by to list
+            if isinstance(by, str):
+                by = [by]
+            
+            self._by_list = by
+            self._agg_exprs = self._compile_aggregations(self.config)
         
-        return data.group_by(by, maintain_order=maintain_order).agg(agg_exprs)
+        return self._by_list, self._agg_exprs
+    
+    @classmethod
+    def _compile_aggregations(cls, config: Dict[str, Any]) -> List[pl.Expr]:
+        """
+        Build the aggregation expressions for a config without touching data.
+        
+        Args:
+            config: Configuration holding the 'aggregations' dictionary
+            
+        Returns:
+            One aliased Polars expression per output column
+            
+        Raises:
+            ConfigurationError: If an aggregation spec is invalid
+        """
+        aggregations = config.get("aggregations")
+        if not isinstance(aggregations, dict):
+            raise ConfigurationError("'aggregations' must be a dictionary")
+        
+        parser = ExpressionParser()
+        return [
+            cls._parse_aggregation(agg_spec, output_name, parser)
+            for output_name, agg_spec in aggregations.items()
+        ]
     
+    @classmethod
     def _parse_aggregation(
-        self, 
+        cls, 
         agg_spec: Any, 
         output_name: str,
+        parser: ExpressionParser,
     ) -> pl.Expr:
         """Parse an aggregation specification into a Polars expression."""
         if isinstance(agg_spec, str):
             # Check if it's a shorthand (just the function name)
-            if agg_spec in self.AGGREGATION_FUNCTIONS:
+            if agg_spec in cls.AGGREGATION_FUNCTIONS:
                 # For shorthand, use the output name as the column
-                return self.AGGREGATION_FUNCTIONS[agg_spec](output_name).alias(output_name)
+                return cls.AGGREGATION_FUNCTIONS[agg_spec](output_name).alias(output_name)
             else:
                 # Try parsing as expression
-                return self._parser.parse(agg_spec).alias(output_name)
+                return parser.parse(agg_spec).alias(output_name)
         
         elif isinstance(agg_spec, dict):
             column = agg_spec.get("column")
@@ -106,13 +142,13 @@ class GroupByTransformer(BaseTransformer):
                     "Aggregation dict must have 'column' and 'agg' keys"
                 )
             
-            if agg not in self.AGGREGATION_FUNCTIONS:
+            if agg not in cls.AGGREGATION_FUNCTIONS:
                 raise ConfigurationError(
                     f"Unknown aggregation '{agg}'. "
-                    f"Allowed: {list(self.AGGREGATION_FUNCTIONS.keys())}"
+                    f"Allowed: {list(cls.AGGREGATION_FUNCTIONS.keys())}"
                 )
             
-            return self.AGGREGATION_FUNCTIONS[agg](column).alias(output_name)
+            return cls.AGGREGATION_FUNCTIONS[agg](column).alias(output_name)
         
         elif isinstance(agg_spec, pl.Expr):
             return agg_spec.alias(output_name)
@@ -122,8 +158,14 @@ class GroupByTransformer(BaseTransformer):
                 f"Invalid aggregation spec type: {type(agg_spec)}"
             )
     
-    def validate_config(self, config: Dict[str, Any]) -> Optional[str]:
-        """Validate the group_by configuration."""
+    @staticmethod
+    def validate_config(config: Dict[str, Any]) -> Optional[str]:
+        """
+        Validate the group_by configuration.
+        
+        Validation only inspects the config, so it can be called on the
+        class without building a transformer.
+        """
         if "by" not in config:
             return "GroupByTransformer requires 'by' configuration"
         if "aggregations" not in config:
@@ -1,6 +1,6 @@
 """CastTransformer - Cast columns to specified data types."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
 
 import polars as pl
 
@@ -9,6 +9,19 @@ from frameworks.data_transformation.engine.transformation_context import Transfo
 from frameworks.data_transformation.exceptions import ConfigurationError
 
 
+# Type names accepted in the 'schema' config, resolved once at import
+_DTYPE_MAP: Dict[str, Any] = {
+    "Int8": pl.Int8, "Int16": pl.Int16, "Int32": pl.Int32, "Int64": pl.Int64,
+    "UInt8": pl.UInt8, "UInt16": pl.UInt16, "UInt32": pl.UInt32, "UInt64": pl.UInt64,
+    "Float32": pl.Float32, "Float64": pl.Float64,
+    "Boolean": pl.Boolean, "Bool": pl.Boolean,
+    "Utf8": pl.Utf8, "String": pl.Utf8,
+    "Date": pl.Date, "Datetime": pl.Datetime, "Time": pl.Time,
+}
+
+_VALID_DTYPES: FrozenSet[str] = frozenset(_DTYPE_MAP)
+
+
 class CastTransformer(BaseTransformer):
     """
     Cast columns to specified data types.
@@ -24,14 +37,7 @@ class CastTransformer(BaseTransformer):
         {"schema": {"age": "Int64", "price": "Float64", "active": "Boolean"}}
     """
     
-    TYPE_MAP = {
-        "Int8": pl.Int8, "Int16": pl.Int16, "Int32": pl.Int32, "Int64": pl.Int64,
-        "UInt8": pl.UInt8, "UInt16": pl.UInt16, "UInt32": pl.UInt32, "UInt64": pl.UInt64,
-        "Float32": pl.Float32, "Float64": pl.Float64,
-        "Boolean": pl.Boolean, "Bool": pl.Boolean,
-        "Utf8": pl.Utf8, "String": pl.Utf8,
-        "Date": pl.Date, "Datetime": pl.Datetime, "Time": pl.Time,
-    }
+    TYPE_MAP = _DTYPE_MAP
     
     @property
     def transformer_type(self) -> str:
@@ -46,29 +52,30 @@ class CastTransformer(BaseTransformer):
         schema = self._get_required("schema", dict)
         strict = self._get_optional("strict", True, bool)
         
-        cast_exprs = []
+        dtypes = {}
         for col_name, type_name in schema.items():
-            if type_name not in self.TYPE_MAP:
+            dtype = _DTYPE_MAP.get(type_name)
+            if dtype is None:
                 raise ConfigurationError(
                     f"Unknown type '{type_name}' for column '{col_name}'. "
-                    f"Supported types: {list(self.TYPE_MAP.keys())}"
+                    f"Supported types: {list(_DTYPE_MAP.keys())}"
                 )
-            cast_exprs.append(
-                pl.col(col_name).cast(self.TYPE_MAP[type_name], strict=strict)
-            )
+            dtypes[col_name] = dtype
         
-        return data.with_columns(cast_exprs)
+        # One cast call covers every column in a single projection
+        return data.cast(dtypes, strict=strict)
     
     def validate_config(self, config: Dict[str, Any]) -> Optional[str]:
         """Validate the cast configuration."""
-        if "schema" not in config:
+        # Error strings are only formatted on the failing branch
+        schema = config.get("schema")
+        if schema is None:
             return "CastTransformer requires 'schema' configuration"
-        if not isinstance(config["schema"], dict):
+        if not isinstance(schema, dict):
             return "'schema' must be a dictionary"
         
-        schema = config["schema"]
         for col_name, type_name in schema.items():
-            if type_name not in self.TYPE_MAP:
+            if type_name not in _VALID_DTYPES:
                 return f"Unknown type '{type_name}' for column '{col_name}'"
         
         return None
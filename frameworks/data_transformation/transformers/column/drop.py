@@ -30,6 +30,8 @@ class DropTransformer(BaseTransformer):
     ) -> pl.DataFrame:
         """Drop specified columns from the DataFrame."""
         columns = self._get_required("columns", list)
+        if not columns:
+            return data
         return data.drop(columns)
     
     def validate_config(self, config: Dict[str, Any]) -> Optional[str]:
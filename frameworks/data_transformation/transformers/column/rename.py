@@ -30,6 +30,8 @@ class RenameTransformer(BaseTransformer):
     ) -> pl.DataFrame:
         """Rename columns according to the mapping."""
         mapping = self._get_required("mapping", dict)
+        if not mapping:
+            return data
         return data.rename(mapping)
     
     def validate_config(self, config: Dict[str, Any]) -> Optional[str]:
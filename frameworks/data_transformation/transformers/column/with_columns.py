@@ -1,6 +1,6 @@
 """WithColumnsTransformer - Add or modify columns using expressions."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import polars as pl
 
@@ -33,6 +33,7 @@ class WithColumnsTransformer(BaseTransformer):
     def __init__(self, name: str, config: Dict[str, Any]) -> None:
         super().__init__(name, config)
         self._parser = ExpressionParser()
+        self._exprs: Optional[List[pl.Expr]] = None
     
     @property
     def transformer_type(self) -> str:
@@ -44,20 +45,35 @@ class WithColumnsTransformer(BaseTransformer):
         context: TransformationContext,
     ) -> pl.DataFrame:
         """Add or modify columns using expressions."""
-        columns = self._get_required("columns", dict)
+        exprs = self._compile()
+        if not exprs:
+            return data
+        return data.with_columns(exprs)
+    
+    def _compile(self) -> List[pl.Expr]:
+        """
+        Build the aliased column expressions from the config.
         
-        exprs = []
-        for col_name, expr_def in columns.items():
-            if isinstance(expr_def, str):
-                expr = self._parser.parse(expr_def)
-            elif isinstance(expr_def, pl.Expr):
-                expr = expr_def
-            else:
-                # Literal value
-                expr = pl.lit(expr_def)
-            exprs.append(expr.alias(col_name))
+        The result is computed on first use and reused by every later
+        transform() call on this instance.
+        """
+        if self._exprs is None:
+            columns = self._get_required("columns", dict)
+            
+            exprs = []
+            for col_name, expr_def in columns.items():
+                if isinstance(expr_def, str):
+                    expr = self._parser.parse(expr_def)
+                elif isinstance(expr_def, pl.Expr):
+                    expr = expr_def
+                else:
+                    # Literal value
+                    expr = pl.lit(expr_def)
+                exprs.append(expr.alias(col_name))
+            
+            self._exprs = exprs
         
-        return data.with_columns(exprs)
+        return self._exprs
     
     def validate_config(self, config: Dict[str, Any]) -> Optional[str]:
         """Validate the with_columns configuration."""
@@ -33,6 +33,10 @@ class JoinTransformer(BaseTransformer):
     
     VALID_JOIN_TYPES = {"inner", "left", "right", "outer", "full", "semi", "anti", "cross"}
     
+    def __init__(self, name: str, config: Dict[str, Any]) -> None:
+        super().__init__(name, config)
+        self._join_kwargs: Optional[Dict[str, Any]] = None
+    
     @property
     def transformer_type(self) -> str:
         return "join"
@@ -48,11 +52,7 @@ class JoinTransformer(BaseTransformer):
     ) -> pl.DataFrame:
         """Join with another dataset from context."""
         right_dataset = self._get_required("right_dataset", str)
-        on = self._get_optional("on", None)
-        left_on = self._get_optional("left_on", None)
-        right_on = self._get_optional("right_on", None)
         how = self._get_optional("how", "inner", str)
-        suffix = self._get_optional("suffix", "_right", str)
         
         # Validate join type
         if how not in self.VALID_JOIN_TYPES:
@@ -67,21 +67,39 @@ class JoinTransformer(BaseTransformer):
                 f"Dataset '{right_dataset}' not found in context"
             )
         
-        # Validate join keys
-        if on is None and (left_on is None or right_on is None):
-            if how != "cross":
-                raise ConfigurationError(
-                    "Join requires either 'on' or both 'left_on' and 'right_on'"
-                )
+        return data.join(right_df, **self._resolve_join_kwargs())
+    
+    def _resolve_join_kwargs(self) -> Dict[str, Any]:
+        """
+        Validate the join keys and build the keyword arguments for join().
+        
+        The result is computed on first use and reused by every later
+        transform() call on this instance. The join type is checked by
+        transform() before the right dataset is looked up.
+        """
+        if self._join_kwargs is None:
+            on = self._get_optional("on", None)
+            left_on = self._get_optional("left_on", None)
+            right_on = self._get_optional("right_on", None)
+            how = self._get_optional("how", "inner", str)
+            suffix = self._get_optional("suffix", "_right", str)
+            
+            # Validate join keys
+            if on is None and (left_on is None or right_on is None):
+                if how != "cross":
+                    raise ConfigurationError(
+                        "Join requires either 'on' or both 'left_on' and 'right_on'"
+                    )
+            
+            self._join_kwargs = {
+                "on": on,
+                "left_on": left_on,
+                "right_on": right_on,
+                "how": how,
+                "suffix": suffix,
+            }
         
-        return data.join(
-            right_df,
-            on=on,
-            left_on=left_on,
-            right_on=right_on,
-            how=how,
-            suffix=suffix,
-        )
+        return self._join_kwargs
     
     def get_required_datasets(self) -> List[str]:
         """Return list of required datasets."""